@@ -5,17 +5,35 @@ A specialized status line tool designed for Claude Code's status line feature.
 Displays git repositories, development servers, and project status directly in Claude Code.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "Ashwini Chaudhary"
 __email__ = "monty.sinngh@gmail.com"
 
-from .config import ConfigManager
-from .core import StatusLineEngine
-from .detection import ProjectDetector, ServerDetector
-from .git import GitManager
-from .logger import get_logger
-from .render import StatusLineRenderer
-from .setup import SetupWizard
+# Public names are imported on first access (PEP 562) so the status line
+# render path only loads the modules it actually uses
+_LAZY_EXPORTS = {
+    "ConfigManager": ".config",
+    "StatusLineEngine": ".core",
+    "ProjectDetector": ".detection",
+    "ServerDetector": ".detection",
+    "GitManager": ".git",
+    "get_logger": ".logger",
+    "StatusLineRenderer": ".render",
+    "SetupWizard": ".setup",
+}
+
+if TYPE_CHECKING:
+    from .config import ConfigManager
+    from .core import StatusLineEngine
+    from .detection import ProjectDetector, ServerDetector
+    from .git import GitManager
+    from .logger import get_logger
+    from .render import StatusLineRenderer
+    from .setup import SetupWizard
 
 __all__ = [
     "ConfigManager",
@@ -27,3 +45,21 @@ __all__ = [
     "StatusLineRenderer",
     "SetupWizard",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first attribute access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in dir()."""
+    return sorted([*globals(), *_LAZY_EXPORTS])
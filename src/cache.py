@@ -0,0 +1,151 @@
+"""Short-lived on-disk caching for CC Status Line."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+def get_cache_dir() -> Path:
+    """Get cross-platform cache directory."""
+    if sys.platform == "win32":
+        # Windows: Use LOCALAPPDATA
+        cache_dir = Path(os.getenv("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        return cache_dir / "cc-status-line" / "cache"
+
+    # Linux/macOS: Use XDG or fallback
+    if xdg_cache := os.getenv("XDG_CACHE_HOME"):
+        return Path(xdg_cache) / "cc-status-line"
+    return Path.home() / ".cache" / "cc-status-line"
+
+
+def _write_json_atomic(file_path: Path, data: Any) -> bool:
+    """Write JSON via a temp file and rename so readers never see a partial file."""
+    tmp_file = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, file_path)
+        return True
+    except OSError:
+        # Caching is best effort; a read-only cache dir must not break the status line
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        return False
+
+
+def _is_fresh(entry: Any, ttl: float) -> bool:
+    """Check an entry read back from disk is well formed and younger than the TTL."""
+    # The file may have been written by another version or edited by hand
+    if not isinstance(entry, dict):
+        return False
+    created = entry.get("created")
+    return isinstance(created, (int, float)) and time.time() - created <= ttl
+
+
+def cache_disabled() -> bool:
+    """Check if caching is disabled through the environment."""
+    return bool(os.getenv("CCSL_NO_CACHE"))
+
+
+class RenderCache:
+    """Cache rendered status lines so back-to-back invocations skip git and port probes.
+
+    One file is kept per project path and overwritten on every render, so the
+    cache never grows beyond the number of workspaces in use.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, ttl: float = 2.0):
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Build a cache key from everything the rendered output depends on."""
+        raw = "|".join(str(part) for part in parts)
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _cache_file(self, project_path: str) -> Path:
+        """Get cache file for a project path."""
+        name = hashlib.blake2b(project_path.encode(), digest_size=8).hexdigest()
+        return self.cache_dir / f"render-{name}.json"
+
+    def get(self, project_path: str, key: str) -> list[str] | None:
+        """Get cached status lines if they match key and are still fresh."""
+        try:
+            with open(self._cache_file(project_path), "rb") as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if not _is_fresh(entry, self.ttl) or entry.get("key") != key:
+            return None
+
+        lines = entry.get("lines")
+        if not isinstance(lines, list) or not all(isinstance(line, str) for line in lines):
+            return None
+        return lines
+
+    def set(self, project_path: str, key: str, lines: list[str]) -> None:
+        """Store status lines for a project."""
+        entry = {"key": key, "created": time.time(), "lines": lines}
+        _write_json_atomic(self._cache_file(project_path), entry)
+
+
+class StatusCache:
+    """Persist per-repository git status between invocations.
+
+    Entries are keyed by absolute repository path and only reused while the
+    repository signature (HEAD, index and FETCH_HEAD mtimes) is unchanged and the entry is
+    younger than the TTL, which bounds staleness for edits git has not indexed yet.
+    """
+
+    def __init__(self, cache_file: Path | None = None, ttl: float = 5.0):
+        self.cache_file = cache_file or get_cache_dir() / "status.json"
+        self.ttl = ttl
+        self._entries: dict[str, Any] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, Any]:
+        """Load cache entries from disk once per instance."""
+        if self._entries is None:
+            try:
+                with open(self.cache_file, "rb") as f:
+                    entries = json.loads(f.read())
+            except (OSError, ValueError):
+                entries = {}
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def get(self, repo_path: str, signature: list[int]) -> dict[str, Any] | None:
+        """Get cached status for a repository if its signature still matches."""
+        entry = self._load().get(repo_path)
+        if not _is_fresh(entry, self.ttl) or entry.get("signature") != signature:
+            return None
+        status = entry.get("status")
+        return status if isinstance(status, dict) else None
+
+    def set(self, repo_path: str, signature: list[int], status: dict[str, Any]) -> None:
+        """Record status for a repository."""
+        self._load()[repo_path] = {"signature": signature, "created": time.time(), "status": status}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write cache entries back to disk if anything changed."""
+        if not self._dirty or self._entries is None:
+            return
+
+        # Drop expired entries so repositories that are no longer used fall out
+        entries = {
+            path: entry for path, entry in self._entries.items() if _is_fresh(entry, self.ttl)
+        }
+        if _write_json_atomic(self.cache_file, entries):
+            self._dirty = False
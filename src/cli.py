@@ -2,30 +2,59 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
+import select
+import sys
 
 import click
-import yaml
 
+from .cache import RenderCache, cache_disabled
 from .config import ConfigManager
 from .core import StatusLineEngine
-from .setup import SetupWizard
+from .git import GitManager
+
+# Claude Code sends a small JSON payload; never wait on or buffer more than this
+_STDIN_MAX_BYTES = 64 * 1024
+_STDIN_TIMEOUT = 0.5
+
+
+def _read_stdin() -> bytes:
+    """Read piped stdin without blocking past a short deadline or a size cap."""
+    if sys.stdin.isatty():
+        return b""
+
+    try:
+        fd = sys.stdin.fileno()
+    except (OSError, ValueError, io.UnsupportedOperation):
+        # Replaced stdin without a real file descriptor (e.g. tests)
+        return sys.stdin.read(_STDIN_MAX_BYTES).encode()
+
+    chunks: list[bytes] = []
+    size = 0
+    while size < _STDIN_MAX_BYTES:
+        # select() only supports pipes on Unix-like systems
+        if sys.platform != "win32":
+            ready, _, _ = select.select([fd], [], [], _STDIN_TIMEOUT)
+            if not ready:
+                break
+        chunk = os.read(fd, _STDIN_MAX_BYTES - size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks)
 
 
 def _get_claude_context() -> dict | None:
     """Get Claude Code context from stdin if available."""
     try:
-        import sys
-
-        if not sys.stdin.isatty():
-            # Read JSON from stdin (Claude Code integration)
-            stdin_data = sys.stdin.read().strip()
-            if stdin_data:
-                # Validate JSON input from Claude Code
-                context = json.loads(stdin_data)
-                return context
-    except (json.JSONDecodeError, OSError):
+        stdin_data = _read_stdin()
+        if stdin_data.strip():
+            # Validate JSON input from Claude Code
+            return json.loads(stdin_data)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         # Not running from Claude Code, continue normally
         pass
     return None
@@ -36,6 +65,13 @@ def _get_claude_context() -> dict | None:
     "--init", "init_project", is_flag=True, help="Initialize configuration for current project"
 )
 @click.option("--setup", "setup_project", is_flag=True, help="Alias for --init")
+@click.option(
+    "--yes",
+    "-y",
+    "assume_yes",
+    is_flag=True,
+    help="Accept detected defaults during --init (writes project-local Claude settings only)",
+)
 @click.option("--config", "show_config", is_flag=True, help="Show current project configuration")
 @click.option("--config-info", is_flag=True, help="Show configuration file locations and sources")
 @click.option("--list-projects", "list_projects", is_flag=True, help="List all configured projects")
@@ -46,6 +82,7 @@ def _get_claude_context() -> dict | None:
 def main(
     init_project,
     setup_project,
+    assume_yes,
     show_config,
     config_info,
     list_projects,
@@ -59,28 +96,31 @@ def main(
 
     # Handle configuration commands
     if init_project or setup_project:
-        wizard = SetupWizard(config_manager)
+        from .setup import SetupWizard
+
+        wizard = SetupWizard(config_manager, assume_yes=assume_yes)
         config = wizard.run_setup()
-        config_manager.save_project_config(config)
+        project_id = config_manager.get_project_id()
+        config_manager.save_project_config(config, project_id)
 
         click.echo(f"\n✅ Configuration saved for project: {config['name']}")
-        click.echo(f"📁 Project ID: {config_manager.get_project_id()}")
+        click.echo(f"📁 Project ID: {project_id}")
         click.echo("\n🚀 Run 'cc-status-line' to see your status line!")
         return
 
     if show_config:
-        config = config_manager.get_config()
         project_id = config_manager.get_project_id()
+        config = config_manager.get_config(project_id=project_id)
 
         click.echo(f"📋 Current Configuration ({project_id})")
         click.echo("=" * 50)
 
-        # Convert to YAML for better readability
-        click.echo(yaml.safe_dump(config, indent=2, default_flow_style=False))
+        # Same JSON rendering as --global-config; default=str covers YAML dates
+        click.echo(json.dumps(config, indent=2, default=str))
         return
 
     if config_info:
-        info = config_manager.get_config_info()
+        info = config_manager.get_config_info(project_id=config_manager.get_project_id())
 
         click.echo("📁 Configuration Information")
         click.echo("=" * 40)
@@ -144,6 +184,22 @@ def display_status_line(config_manager: ConfigManager):
     project_path = None
     if claude_context and "workspace" in claude_context:
         project_path = claude_context["workspace"].get("current_working_directory")
+    if project_path is None:
+        project_path = config_manager._find_git_root() or os.getcwd()
+
+    # Reuse a very recent render when neither config nor HEAD have changed
+    cache = None if cache_disabled() else RenderCache()
+    cache_key = ""
+    if cache:
+        cache_key = RenderCache.make_key(
+            *config_manager.get_config_fingerprint(project_path),
+            GitManager.head_fingerprint(project_path),
+        )
+        cached_lines = cache.get(project_path, cache_key)
+        if cached_lines is not None:
+            for line in cached_lines:
+                click.echo(line)
+            return
 
     config = config_manager.get_config(project_path)
 
@@ -156,10 +212,22 @@ def display_status_line(config_manager: ConfigManager):
     engine = StatusLineEngine(config)
     status_lines = engine.generate_status_line()
 
+    if cache:
+        cache.set(project_path, cache_key, status_lines)
+
     # Display status lines
     for line in status_lines:
         click.echo(line)
 
 
-if __name__ == "__main__":
+def run() -> None:
+    """Console script entry point with a fast path for the plain status line render."""
+    # Claude Code always runs the bare command, so skip option parsing entirely
+    if len(sys.argv) == 1:
+        display_status_line(ConfigManager())
+        return
     main()
+
+
+if __name__ == "__main__":
+    run()
@@ -12,8 +12,98 @@ from typing import Any
 
 import yaml
 
+try:
+    # libyaml C bindings are much faster than the pure-Python implementation
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 # ProjectConfig removed - using plain dictionaries for YAML compatibility
 
+# Fallback when .git/config can't be read directly
+_GIT_REMOTE_URL_CMD = ("git", "remote", "get-url", "origin")
+
+# Matches the url of the origin remote, staying within its section of .git/config
+_ORIGIN_URL_RE = re.compile(r'\[remote "origin"\][^\[]*?^\s*url\s*=\s*(\S+)', re.M | re.S)
+
+# Remote URLs that git passes through unchanged: scheme://... or user@host:path.
+# Anything else may be an insteadOf alias (e.g. "gh:user/repo") only git can expand.
+_FULL_REMOTE_URL_RE = re.compile(r"^(?:[A-Za-z][\w+.-]*://|[^@/\s]+@[^:/\s]+:)")
+
+# Git config lines that change how URLs resolve ("insteadOf", "[include]", "[includeIf]")
+_URL_REWRITE_RE = re.compile(r"insteadof|^\s*\[include", re.I | re.M)
+
+# Where git looks for system config on common installs (distro, Homebrew Intel/Apple Silicon)
+_SYSTEM_GIT_CONFIGS = ("/etc/gitconfig", "/usr/local/etc/gitconfig", "/opt/homebrew/etc/gitconfig")
+
+# Project id sanitizing: github.com/user/repo -> github-com-user-repo
+_UNSAFE_CHARS_RE = re.compile(r"[^\w\-.]")
+_DASH_RUN_RE = re.compile(r"-+")
+
+# list_projects only needs these top-level keys, usually found near the top of the file
+_PROJECT_SUMMARY_KEYS = ("name", "type", "root_path")
+# A value wrapped onto indented continuation lines is not matched, so it takes the full parse
+_SUMMARY_LINE_RE = re.compile(r"^(?:name|type|root_path):[ \t]*\S.*$(?=\n(?![ \t])|\Z)", re.M)
+_SUMMARY_HEAD_CHARS = 2048
+
+# Built once at import; read-only, so callers always get a _copy_tree() of it
+_DEFAULT_GLOBAL_CONFIG: dict[str, Any] = {
+    "version": "1.0.0",
+    "output_format": {
+        "colors": True,
+        "multiline": True,
+        "compact": False,
+        "show_changes": True,
+    },
+    "system_monitoring": {
+        "enabled": False,  # Disabled by default for Claude Code compatibility
+        "battery": False,
+        "cpu": False,
+        "memory": False,
+    },
+    "server_templates": {
+        # Generic templates - users can extend these
+        "web": {
+            "name": "Web",
+            "ports": [3000, 8000, 8080],
+            "emoji": "🌐",
+            "patterns": ["index.html", "package.json"],
+        },
+        "api": {
+            "name": "API",
+            "ports": [8000, 5000, 3001],
+            "emoji": "🔌",
+            "patterns": ["server.py", "app.py", "main.py"],
+        },
+        "flask": {
+            "name": "Flask",
+            "ports": [5000, 5001, 8000],
+            "emoji": "🌶️",
+            "patterns": ["app.py", "wsgi.py", "application.py", "requirements.txt"],
+        },
+        "database": {
+            "name": "Database",
+            "ports": [5432, 3306, 27017],
+            "emoji": "🗄️",
+            "patterns": ["docker-compose.yml"],
+        },
+    },
+}
+
+
+def _copy_tree(value: Any) -> Any:
+    """Copy the dicts and lists of a YAML-style config tree; scalars are shared as-is.
+
+    Much cheaper than copy.deepcopy for plain config data, which has no cycles or
+    custom objects to track.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(item) for item in value]
+    return value
+
 
 class ConfigManager:
     """YAML-based configuration management with layered fallbacks."""
@@ -24,6 +114,12 @@ class ConfigManager:
         self.global_config_file = self.config_dir / "config.yaml"
         self.projects_dir = self.config_dir / "projects"
         self.templates_dir = self.config_dir / "templates"
+        self._projects_dir_str = str(self.projects_dir)
+        self._git_root_cache: dict[str, str | None] = {}
+        self._remote_cache: dict[str, str | None] = {}
+        self._shared_url_rewrites: bool | None = None
+        self._project_id_cache: dict[str | None, str] = {}
+        self._yaml_cache: dict[Path, tuple[int, int, dict[str, Any] | None]] = {}
         self._ensure_config_dirs()
 
     def _get_config_dir(self) -> Path:
@@ -51,130 +147,265 @@ class ConfigManager:
 
     def get_project_id(self, project_path: str | None = None) -> str:
         """Get unique project identifier based on git remote URL."""
+        # Resolve before the cache lookup so None follows the current directory
         if project_path is None:
             project_path = self._find_git_root() or os.getcwd()
 
+        if project_path in self._project_id_cache:
+            return self._project_id_cache[project_path]
+
+        project_id = self._compute_project_id(project_path)
+        self._project_id_cache[project_path] = project_id
+        return project_id
+
+    def _compute_project_id(self, project_path: str) -> str:
+        """Compute project identifier for a resolved project path."""
         # Try to get git remote URL for global uniqueness
         git_remote = self._get_git_remote_url(project_path)
         if git_remote:
             # Convert git remote to safe filename: github.com/user/repo -> github-com-user-repo
-            safe_name = re.sub(r"[^\w\-.]", "-", git_remote.lower())
-            safe_name = re.sub(r"-+", "-", safe_name)  # Collapse multiple dashes
+            safe_name = _UNSAFE_CHARS_RE.sub("-", git_remote.lower())
+            safe_name = _DASH_RUN_RE.sub("-", safe_name)  # Collapse multiple dashes
             return safe_name.strip("-")
 
-        # Fallback to path hash for non-git projects
-        normalized_path = Path(project_path).resolve()
-        project_hash = hashlib.sha256(str(normalized_path).encode()).hexdigest()[:16]
+        # Fallback to path hash for non-git projects. The id names saved config files,
+        # so the canonical path and sha256 must stay as they are to keep ids stable.
+        normalized_path = os.path.realpath(project_path)
+        project_hash = hashlib.sha256(normalized_path.encode()).hexdigest()[:16]
         return f"local-{project_hash}"
 
     def _get_git_remote_url(self, project_path: str) -> str | None:
         """Get git remote URL for project identification."""
+        if project_path in self._remote_cache:
+            return self._remote_cache[project_path]
+
+        # Reading .git/config avoids spawning git on every status line render
+        url = self._read_git_remote_from_config(project_path)
+        if url is None:
+            url = self._run_git_remote_get_url(project_path)
+
+        remote = self._normalize_git_url(url) if url else None
+        self._remote_cache[project_path] = remote
+        return remote
+
+    def _read_git_remote_from_config(self, project_path: str) -> str | None:
+        """Read origin remote URL directly from .git/config."""
+        # .git may be a file for worktrees and submodules; leave those to git itself
+        config_file = Path(project_path) / ".git" / "config"
         try:
+            with open(config_file, encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        # URL rewrites and includes are applied by git, not by this shortcut
+        if _URL_REWRITE_RE.search(content) or self._has_shared_url_rewrites():
+            return None
+
+        match = _ORIGIN_URL_RE.search(content)
+        if not match or not _FULL_REMOTE_URL_RE.match(match.group(1)):
+            return None
+        return match.group(1)
+
+    def _has_shared_url_rewrites(self) -> bool:
+        """Check whether global or system git config may rewrite remote URLs."""
+        if self._shared_url_rewrites is None:
+            self._shared_url_rewrites = self._scan_shared_git_configs()
+        return self._shared_url_rewrites
+
+    @staticmethod
+    def _scan_shared_git_configs() -> bool:
+        """Scan the git config files shared by all repos for URL rewrites or includes."""
+        # Windows installs keep system config under an install-specific prefix, and
+        # config passed through the environment cannot be read here either
+        if os.name == "nt" or {"GIT_CONFIG_PARAMETERS", "GIT_CONFIG_COUNT"} & os.environ.keys():
+            return True
+
+        global_config = os.environ.get("GIT_CONFIG_GLOBAL")
+        if global_config:
+            paths = [global_config]
+        else:
+            home = Path.home()
+            xdg_config = os.environ.get("XDG_CONFIG_HOME") or str(home / ".config")
+            paths = [str(home / ".gitconfig"), os.path.join(xdg_config, "git", "config")]
+        if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+            system_config = os.environ.get("GIT_CONFIG_SYSTEM")
+            paths.extend([system_config] if system_config else _SYSTEM_GIT_CONFIGS)
+
+        for path in paths:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                continue
+            except (OSError, UnicodeDecodeError):
+                # Present but unreadable here: only git can tell what it says
+                return True
+            if _URL_REWRITE_RE.search(content):
+                return True
+        return False
+
+    def _run_git_remote_get_url(self, project_path: str) -> str | None:
+        """Get origin remote URL by asking git."""
+        try:
+            # Only stdout is needed: skip the stderr pipe and text-mode wrappers
             result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
+                _GIT_REMOTE_URL_CMD,
                 cwd=project_path,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=5.0,
             )
             if result.returncode == 0:
-                url = result.stdout.strip()
-                # Normalize different git URL formats
-                # ssh: git@github.com:user/repo.git -> github.com/user/repo
-                # https: https://github.com/user/repo.git -> github.com/user/repo
-                if url.startswith("git@"):
-                    url = url.replace("git@", "").replace(":", "/")
-                elif url.startswith("https://"):
-                    url = url[8:]  # Remove https://
-
-                # Remove .git suffix
-                if url.endswith(".git"):
-                    url = url[:-4]
-
-                return url
+                return result.stdout.decode("utf-8", "replace").strip() or None
         except (subprocess.TimeoutExpired, OSError, FileNotFoundError):
             pass
         return None
 
+    @staticmethod
+    def _normalize_git_url(url: str) -> str:
+        """Normalize different git URL formats."""
+        # ssh: git@github.com:user/repo.git -> github.com/user/repo
+        # https: https://github.com/user/repo.git -> github.com/user/repo
+        if url.startswith("git@"):
+            url = url.replace("git@", "").replace(":", "/")
+        elif url.startswith("https://"):
+            url = url[8:]  # Remove https://
+
+        # Remove .git suffix
+        if url.endswith(".git"):
+            url = url[:-4]
+
+        return url
+
     def _find_git_root(self) -> str | None:
         """Find git repository root."""
-        current = Path.cwd()
+        cwd = os.getcwd()
+        if cwd in self._git_root_cache:
+            return self._git_root_cache[cwd]
+
+        git_root = None
+        current = Path(cwd)
         while current != current.parent:
-            if (current / ".git").exists():
-                return str(current)
+            if os.path.lexists(os.path.join(current, ".git")):
+                git_root = str(current)
+                break
             current = current.parent
-        return None
 
-    def get_config(self, project_path: str | None = None) -> dict[str, Any]:
-        """Get complete configuration with layered resolution."""
-        # 1. Start with global defaults
-        config = self._get_default_global_config()
+        self._git_root_cache[cwd] = git_root
+        return git_root
 
-        # 2. Load global config (templates, user defaults)
-        global_config = self._load_yaml_file(self.global_config_file)
-        if global_config:
-            config = self._deep_merge(config, global_config)
+    def _project_file(self, project_id: str) -> Path:
+        """Get path of the project-specific config file."""
+        return Path(os.path.join(self._projects_dir_str, project_id + ".yaml"))
 
-        # 3. Load project-specific config
-        project_id = self.get_project_id(project_path)
-        project_file = self.projects_dir / f"{project_id}.yaml"
-        project_config = self._load_yaml_file(project_file)
-        if project_config:
-            config = self._deep_merge(config, project_config)
+    @staticmethod
+    def _local_file(project_path: str) -> Path:
+        """Get path of the local override file."""
+        return Path(os.path.join(project_path, ".cc-status-line.yaml"))
 
-        # 4. Load local overrides
+    def get_config(
+        self, project_path: str | None = None, project_id: str | None = None
+    ) -> dict[str, Any]:
+        """Get complete configuration with layered resolution."""
+        if project_id is None:
+            project_id = self.get_project_id(project_path)
         if project_path is None:
             project_path = self._find_git_root() or os.getcwd()
-        local_file = Path(project_path) / ".cc-status-line.yaml"
-        local_config = self._load_yaml_file(local_file)
-        if local_config:
-            config = self._deep_merge(config, local_config)
+
+        # Start with a private copy of the built-in defaults; layers are copied in on merge
+        config = _copy_tree(_DEFAULT_GLOBAL_CONFIG)
+        for layer_file in self._get_layer_files(project_path, project_id):
+            layer_config = self._load_yaml_file(layer_file)
+            if layer_config:
+                self._merge_into(config, layer_config)
 
         return config
 
+    def _get_layer_files(self, project_path: str, project_id: str) -> tuple[Path, Path, Path]:
+        """Get config files from lowest to highest priority: global, project, local."""
+        return (
+            self.global_config_file,
+            self._project_file(project_id),
+            self._local_file(project_path),
+        )
+
+    def get_config_fingerprint(self, project_path: str) -> tuple[Any, ...]:
+        """Get a cheap fingerprint that changes whenever any config layer changes."""
+        project_id = self.get_project_id(project_path)
+        fingerprint: list[Any] = [project_path, project_id]
+        for layer_file in self._get_layer_files(project_path, project_id):
+            try:
+                stat = os.stat(layer_file)
+                fingerprint.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
     def _load_yaml_file(self, file_path: Path) -> dict[str, Any] | None:
-        """Load and parse YAML file safely."""
-        if not file_path.exists():
+        """Load and parse YAML file safely, reusing the parse while the file is unchanged."""
+        try:
+            stat = file_path.stat()
+        except OSError:
             return None
 
+        cached = self._yaml_cache.get(file_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
         try:
             with open(file_path) as f:
-                content = yaml.safe_load(f)
-                return content if isinstance(content, dict) else None
+                content = yaml.load(f, Loader=SafeLoader)
         except (yaml.YAMLError, OSError):
             return None
 
-    def _deep_merge(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-        """Deep merge two dictionaries, with override taking precedence."""
-        result = base.copy()
+        result = content if isinstance(content, dict) else None
+        self._yaml_cache[file_path] = (stat.st_mtime_ns, stat.st_size, result)
+        return result
 
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+    def _save_yaml_file(self, file_path: Path, config: dict[str, Any]) -> None:
+        """Serialize configuration to a YAML file."""
+        with open(file_path, "w") as f:
+            yaml.dump(config, f, Dumper=SafeDumper, indent=2, default_flow_style=False)
+        self._yaml_cache.pop(file_path, None)
+
+    def _merge_into(self, dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
+        """Deep merge src into dst in place, with src taking precedence.
+
+        dst must be owned by the caller; values taken from src are copied, so the
+        cached YAML layers are never shared with or written through the result.
+        """
+        for key, value in src.items():
+            if isinstance(value, dict):
+                target = dst.get(key)
+                if not isinstance(target, dict):
+                    target = dst[key] = {}
+                self._merge_into(target, value)
             else:
-                result[key] = value
+                dst[key] = _copy_tree(value)
 
-        return result
+        return dst
 
     def get_global_config(self) -> dict[str, Any]:
         """Get global configuration."""
-        config = self._load_yaml_file(self.global_config_file)
-        if config:
-            return self._deep_merge(self._get_default_global_config(), config)
-        return self._get_default_global_config()
+        config = _copy_tree(_DEFAULT_GLOBAL_CONFIG)
+        global_config = self._load_yaml_file(self.global_config_file)
+        if global_config:
+            self._merge_into(config, global_config)
+        return config
 
     def save_global_config(self, config: dict[str, Any]) -> None:
         """Save global configuration."""
-        with open(self.global_config_file, "w") as f:
-            yaml.safe_dump(config, f, indent=2, default_flow_style=False)
+        self._save_yaml_file(self.global_config_file, config)
 
     def get_project_config(self, project_id: str | None = None) -> dict[str, Any] | None:
         """Get project-specific configuration."""
         if project_id is None:
             project_id = self.get_project_id()
 
-        project_file = self.projects_dir / f"{project_id}.yaml"
-        return self._load_yaml_file(project_file)
+        # Copy so callers can edit the result without touching the parse cache
+        project_config = self._load_yaml_file(self._project_file(project_id))
+        return _copy_tree(project_config) if project_config is not None else None
 
     def save_project_config(self, config: dict[str, Any], project_id: str | None = None) -> None:
         """Save project-specific configuration."""
@@ -184,48 +415,81 @@ class ConfigManager:
         # Update timestamp
         config["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
 
-        project_file = self.projects_dir / f"{project_id}.yaml"
-        with open(project_file, "w") as f:
-            yaml.safe_dump(config, f, indent=2, default_flow_style=False)
+        project_file = self._project_file(project_id)
+        self._save_yaml_file(project_file, config)
 
     def save_local_config(self, config: dict[str, Any], project_path: str | None = None) -> None:
         """Save local project overrides."""
         if project_path is None:
             project_path = self._find_git_root() or os.getcwd()
 
-        local_file = Path(project_path) / ".cc-status-line.yaml"
-        with open(local_file, "w") as f:
-            yaml.safe_dump(config, f, indent=2, default_flow_style=False)
+        local_file = self._local_file(project_path)
+        self._save_yaml_file(local_file, config)
 
     def delete_project_config(self, project_id: str | None = None) -> bool:
         """Delete project-specific configuration."""
         if project_id is None:
             project_id = self.get_project_id()
 
-        project_file = self.projects_dir / f"{project_id}.yaml"
-        if project_file.exists():
+        project_file = self._project_file(project_id)
+        if os.path.exists(project_file):
             project_file.unlink()
             return True
         return False
 
     def list_projects(self) -> list[dict[str, Any]]:
-        """List all configured projects."""
+        """List configured projects with their name, type and root path."""
         projects = []
-        for config_file in self.projects_dir.glob("*.yaml"):
-            config = self._load_yaml_file(config_file)
-            if config:
-                config["id"] = config_file.stem
-                projects.append(config)
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml") or not entry.is_file():
+                    continue
+                summary = self._read_project_summary(Path(entry.path))
+                if summary is not None:
+                    summary["id"] = entry.name[: -len(".yaml")]
+                    projects.append(summary)
         return projects
 
-    def get_config_info(self, project_path: str | None = None) -> dict[str, Any]:
+    def _read_project_summary(self, config_file: Path) -> dict[str, Any] | None:
+        """Read top-level project metadata, parsing the whole file only when needed."""
+        try:
+            with open(config_file, encoding="utf-8") as f:
+                head = f.read(_SUMMARY_HEAD_CHARS)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        # Drop a line that may have been cut off by the read limit, keeping its first
+        # character so the last whole line can still be checked for a continuation
+        if len(head) == _SUMMARY_HEAD_CHARS:
+            head = head[: head.rfind("\n") + 2]
+
+        lines = _SUMMARY_LINE_RE.findall(head)
+        if len(lines) == len(_PROJECT_SUMMARY_KEYS):
+            try:
+                summary = yaml.load("\n".join(lines), Loader=SafeLoader)
+            except yaml.YAMLError:
+                summary = None
+            if isinstance(summary, dict) and all(
+                isinstance(summary.get(key), str) for key in _PROJECT_SUMMARY_KEYS
+            ):
+                return summary
+
+        config = self._load_yaml_file(config_file)
+        if not config:
+            return None
+        return {key: _copy_tree(config[key]) for key in _PROJECT_SUMMARY_KEYS if key in config}
+
+    def get_config_info(
+        self, project_path: str | None = None, project_id: str | None = None
+    ) -> dict[str, Any]:
         """Get information about configuration sources."""
         if project_path is None:
             project_path = self._find_git_root() or os.getcwd()
 
-        project_id = self.get_project_id(project_path)
-        project_file = self.projects_dir / f"{project_id}.yaml"
-        local_file = Path(project_path) / ".cc-status-line.yaml"
+        if project_id is None:
+            project_id = self.get_project_id(project_path)
+        project_file = self._project_file(project_id)
+        local_file = self._local_file(project_path)
 
         return {
             "project_id": project_id,
@@ -234,53 +498,12 @@ class ConfigManager:
             "project_config": str(project_file),
             "local_config": str(local_file),
             "sources": {
-                "global_exists": self.global_config_file.exists(),
-                "project_exists": project_file.exists(),
-                "local_exists": local_file.exists(),
+                "global_exists": os.path.exists(self.global_config_file),
+                "project_exists": os.path.exists(project_file),
+                "local_exists": os.path.exists(local_file),
             },
         }
 
     def _get_default_global_config(self) -> dict[str, Any]:
         """Get default global configuration with no project-specific assumptions."""
-        return {
-            "version": "1.0.0",
-            "output_format": {
-                "colors": True,
-                "multiline": True,
-                "compact": False,
-                "show_changes": True,
-            },
-            "system_monitoring": {
-                "enabled": False,  # Disabled by default for Claude Code compatibility
-                "battery": False,
-                "cpu": False,
-                "memory": False,
-            },
-            "server_templates": {
-                # Generic templates - users can extend these
-                "web": {
-                    "name": "Web",
-                    "ports": [3000, 8000, 8080],
-                    "emoji": "🌐",
-                    "patterns": ["index.html", "package.json"],
-                },
-                "api": {
-                    "name": "API",
-                    "ports": [8000, 5000, 3001],
-                    "emoji": "🔌",
-                    "patterns": ["server.py", "app.py", "main.py"],
-                },
-                "flask": {
-                    "name": "Flask",
-                    "ports": [5000, 5001, 8000],
-                    "emoji": "🌶️",
-                    "patterns": ["app.py", "wsgi.py", "application.py", "requirements.txt"],
-                },
-                "database": {
-                    "name": "Database",
-                    "ports": [5432, 3306, 27017],
-                    "emoji": "🗄️",
-                    "patterns": ["docker-compose.yml"],
-                },
-            },
-        }
+        return _copy_tree(_DEFAULT_GLOBAL_CONFIG)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
+from functools import cached_property
 from typing import Any
 
+from .cache import StatusCache, cache_disabled
 from .detection import ServerDetector
 from .git import GitManager
 from .logger import get_logger
@@ -17,14 +19,27 @@ class StatusLineEngine:
     def __init__(self, config: dict[str, Any]):
         self.config = config
         self.logger = get_logger("core", config)
-        self.git_manager = GitManager()
-        self.server_detector = ServerDetector()
-        self.renderer = StatusLineRenderer(config)
 
         self.logger.debug(
             f"StatusLineEngine initialized for project: {config.get('name', 'unknown')}"
         )
 
+    # Helpers are built on first use so unconfigured sections cost nothing
+    @cached_property
+    def git_manager(self) -> GitManager:
+        """Git manager for repository status."""
+        return GitManager(None if cache_disabled() else StatusCache())
+
+    @cached_property
+    def server_detector(self) -> ServerDetector:
+        """Detector for active development servers."""
+        return ServerDetector()
+
+    @cached_property
+    def renderer(self) -> StatusLineRenderer:
+        """Renderer for the final status line output."""
+        return StatusLineRenderer(self.config)
+
     def generate_status_line(self) -> list[str]:
         """Generate complete status line."""
         try:
@@ -49,17 +64,16 @@ class StatusLineEngine:
 
     def _get_repository_statuses(self) -> list[Any]:
         """Get status for all configured repositories."""
-        repos = []
-        project_root = self.config.get("root_path", os.getcwd())
-
-        for repo_config in self.config.get("repositories", []):
-            repo_status = self.git_manager.get_repo_status(repo_config, project_root)
-            if repo_status:
-                repos.append(repo_status)
+        repo_configs = self.config.get("repositories")
+        if not repo_configs:
+            return []
 
-        return repos
+        project_root = self.config.get("root_path", os.getcwd())
+        return self.git_manager.get_repo_statuses(repo_configs, project_root)
 
     def _detect_active_servers(self) -> list[dict[str, Any]]:
         """Detect active servers."""
-        server_configs = self.config.get("servers", [])
+        server_configs = self.config.get("servers")
+        if not server_configs:
+            return []
         return self.server_detector.detect_servers(server_configs)
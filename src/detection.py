@@ -2,20 +2,182 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
 import subprocess
 import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+# Dependency, build and VCS directories are never descended into when matching project files
+_PRUNED_DIRS = frozenset(
+    {".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build", ".tox"}
+)
+
+# "path = <dir>" lines in .gitmodules
+_SUBMODULE_PATH_RE = re.compile(r"\s*path\s*=\s*(.+?)\s*$")
+
+# Files deeper than this below the project root are not considered for server suggestions
+_MAX_INDEX_DEPTH = 3
+
+# Local port of a LISTEN (state 0A) socket in /proc/net/tcp{,6}:
+# "  sl  local_address rem_address   st ..." with addresses as HEXIP:HEXPORT
+_PROC_LISTEN_RE = re.compile(rb"^ *\d+: [0-9A-F]+:([0-9A-F]{4}) [0-9A-F]+:[0-9A-F]{4} 0A ", re.M)
+
+_LSOF_LISTEN_CMD = ("lsof", "-nP", "-iTCP", "-sTCP:LISTEN")
+_NETSTAT_CMD = ("netstat", "-an")
+
+# "*:3000 (LISTEN)" in `lsof -nP -iTCP -sTCP:LISTEN` output
+_LSOF_PORT_RE = re.compile(r":(\d+) \(LISTEN\)")
+
+# Local port of a listening socket in `netstat -an` output; ports are separated by
+# ":" on Linux/Windows and "." on macOS, and Windows spells the state LISTENING
+_NETSTAT_LISTEN_RE = re.compile(r"[.:](\d+)\s+\S+\s+LISTEN")
+
+
+@dataclass(slots=True)
+class FileIndex:
+    """Names seen in a single bounded walk of the project tree."""
+
+    file_names: set[str] = field(default_factory=set)
+    extensions: set[str] = field(default_factory=set)
+    dir_names: set[str] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, root: Path, max_depth: int = _MAX_INDEX_DEPTH) -> FileIndex:
+        """Walk root once with os.scandir, skipping pruned directories."""
+        index = cls()
+        pending = [(str(root), 0)]
+        while pending:
+            path, depth = pending.pop()
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            index.dir_names.add(entry.name)
+                            if depth < max_depth and entry.name not in _PRUNED_DIRS:
+                                pending.append((entry.path, depth + 1))
+                        else:
+                            index.file_names.add(entry.name)
+                            index.extensions.add(os.path.splitext(entry.name)[1])
+            except OSError:
+                continue
+        return index
+
+    def matches(self, pattern: str) -> bool:
+        """Check a pattern against the index without touching the filesystem."""
+        # A trailing slash only matches directories, e.g. "node_modules/"
+        if pattern.endswith("/"):
+            return self._matches_names(pattern.rstrip("/"), self.dir_names)
+
+        # "*.py" style patterns reduce to an extension lookup
+        suffix = pattern[1:]
+        if pattern.startswith("*.") and suffix.count(".") == 1 and not _has_magic(suffix):
+            return suffix in self.extensions
+
+        return self._matches_names(pattern, self.file_names)
+
+    @staticmethod
+    def _matches_names(pattern: str, names: set[str]) -> bool:
+        """Match a literal name or glob against a set of names."""
+        if not _has_magic(pattern):
+            return pattern in names
+        return any(fnmatch.fnmatch(name, pattern) for name in names)
+
+
+def _has_magic(pattern: str) -> bool:
+    """Check if a pattern contains glob wildcards."""
+    return any(c in pattern for c in "*?[")
+
+
+@dataclass(frozen=True, slots=True)
+class ServerPattern:
+    """Files that suggest a development server, pre-sorted by how they are matched."""
+
+    name: str
+    ports: tuple[int, ...]
+    emoji: str
+    file_names: frozenset[str] = frozenset()
+    extensions: frozenset[str] = frozenset()
+    dir_names: frozenset[str] = frozenset()
+    globs: tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls, name: str, ports: tuple[int, ...], emoji: str, patterns: tuple[str, ...]
+    ) -> ServerPattern:
+        """Classify patterns once so matching is set intersection against a FileIndex."""
+        file_names, extensions, dir_names, globs = set(), set(), set(), []
+        for pattern in patterns:
+            suffix = pattern[1:]
+            if pattern.endswith("/") and not _has_magic(pattern):
+                dir_names.add(pattern.rstrip("/"))
+            elif pattern.startswith("*.") and suffix.count(".") == 1 and not _has_magic(suffix):
+                extensions.add(suffix)
+            elif _has_magic(pattern):
+                globs.append(pattern)
+            else:
+                file_names.add(pattern)
+        return cls(
+            name,
+            ports,
+            emoji,
+            frozenset(file_names),
+            frozenset(extensions),
+            frozenset(dir_names),
+            tuple(globs),
+        )
+
+    def matches(self, index: FileIndex) -> bool:
+        """Check if any pattern is present in the project file index."""
+        return (
+            not self.file_names.isdisjoint(index.file_names)
+            or not self.extensions.isdisjoint(index.extensions)
+            or not self.dir_names.isdisjoint(index.dir_names)
+            or any(index.matches(pattern) for pattern in self.globs)
+        )
+
+
+# Generic development server patterns - users can extend via config
+SERVER_PATTERNS = (
+    ServerPattern.build(
+        "Flask",
+        (5000, 5001, 8000),
+        "🌶️",
+        ("app.py", "wsgi.py", "application.py", "requirements.txt"),
+    ),
+    ServerPattern.build(
+        "Python", (8000, 5000), "🐍", ("*.py", "requirements.txt", "pyproject.toml")
+    ),
+    ServerPattern.build("Node", (3000, 8080), "🟢", ("package.json", "node_modules/")),
+    ServerPattern.build("Web", (8080, 3000, 5173), "🌐", ("index.html", "*.css", "*.js")),
+    ServerPattern.build("Docker", (80, 443, 8080), "🐳", ("docker-compose.yml", "Dockerfile")),
+    ServerPattern.build("Database", (5432, 3306, 27017), "🗄️", ("*.sql", "migrations/")),
+)
+
 
 class ProjectDetector:
     """Detect project type and suggest configuration."""
 
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
+        self._file_index: FileIndex | None = None
+        self._submodules: list[str] | None = None
+        self._subdir_repos: list[str] | None = None
+        self._detected_type: str | None = None
 
     def detect_project_type(self) -> str:
-        """Detect the type of project."""
+        """Detect the type of project, probing the filesystem only on first call."""
+        if self._detected_type is None:
+            self._detected_type = self._detect_project_type()
+        return self._detected_type
+
+    def _detect_project_type(self) -> str:
+        """Run project type detection."""
         if self._is_monolith():
             return "monolith"
         elif self._is_multi_repo():
@@ -26,14 +188,14 @@ class ProjectDetector:
 
     def _is_monolith(self) -> bool:
         """Check if this is a monolith with submodules."""
-        gitmodules = self.project_path / ".gitmodules"
-        return gitmodules.exists() and len(self._get_submodules()) > 2
+        if self._submodules is not None:
+            return len(self._submodules) > 2
+        return self._count_submodules_at_least(3)
 
     def _is_multi_repo(self) -> bool:
         """Check if this is a multi-repository workspace."""
         # Look for multiple git repositories in subdirectories
-        git_repos = list(self.project_path.glob("*/.git"))
-        return len(git_repos) > 1
+        return len(self._get_subdir_repos()) > 1
 
     def _is_single_repo(self) -> bool:
         """Check if this is a single repository."""
@@ -41,22 +203,41 @@ class ProjectDetector:
 
     def _get_submodules(self) -> list[str]:
         """Get list of git submodules."""
-        gitmodules = self.project_path / ".gitmodules"
-        if not gitmodules.exists():
-            return []
+        if self._submodules is not None:
+            return self._submodules
+
+        self._submodules = list(self._iter_submodules())
+        return self._submodules
 
+    def _count_submodules_at_least(self, count: int) -> bool:
+        """Check for at least count submodules, stopping as soon as they are found."""
+        return sum(1 for _ in islice(self._iter_submodules(), count)) == count
+
+    def _iter_submodules(self) -> Iterator[str]:
+        """Yield submodule paths from .gitmodules one line at a time."""
         try:
-            with open(gitmodules) as f:
-                content = f.read()
-
-            submodules = []
-            for line in content.split("\n"):
-                if line.strip().startswith("path = "):
-                    path = line.split("=", 1)[1].strip()
-                    submodules.append(path)
-            return submodules
+            with open(self.project_path / ".gitmodules") as f:
+                for line in f:
+                    if match := _SUBMODULE_PATH_RE.match(line):
+                        yield match.group(1)
         except OSError:
-            return []
+            return
+
+    def _get_subdir_repos(self) -> list[str]:
+        """Get names of direct subdirectories that contain a .git entry."""
+        if self._subdir_repos is not None:
+            return self._subdir_repos
+
+        try:
+            with os.scandir(self.project_path) as entries:
+                self._subdir_repos = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and os.path.lexists(os.path.join(entry.path, ".git"))
+                ]
+        except OSError:
+            self._subdir_repos = []
+        return self._subdir_repos
 
     def suggest_repositories(self) -> list[dict[str, Any]]:
         """Suggest repository configuration based on project type."""
@@ -82,20 +263,10 @@ class ProjectDetector:
 
     def _suggest_multi_repos(self) -> list[dict[str, Any]]:
         """Suggest repositories for multi-repo workspace."""
-        repos = []
-
-        for git_dir in self.project_path.glob("*/.git"):
-            repo_path = git_dir.parent
-            name = repo_path.name.upper()
-            repos.append(
-                {
-                    "name": name,
-                    "path": str(repo_path.relative_to(self.project_path)),
-                    "type": "repository",
-                }
-            )
-
-        return repos
+        return [
+            {"name": name.upper(), "path": name, "type": "repository"}
+            for name in self._get_subdir_repos()
+        ]
 
     def _suggest_single_repo(self) -> list[dict[str, Any]]:
         """Suggest repository for single repo project."""
@@ -103,68 +274,23 @@ class ProjectDetector:
 
     def suggest_servers(self) -> list[dict[str, Any]]:
         """Suggest server configuration based on project files."""
-        servers = []
-
-        # Generic development server patterns - users can extend via config
-        server_patterns = [
-            {
-                "name": "Flask",
-                "ports": [5000, 5001, 8000],
-                "emoji": "🌶️",
-                "patterns": ["app.py", "wsgi.py", "application.py", "requirements.txt"],
-            },
-            {
-                "name": "Python",
-                "ports": [8000, 5000],
-                "emoji": "🐍",
-                "patterns": ["*.py", "requirements.txt", "pyproject.toml"],
-            },
-            {
-                "name": "Node",
-                "ports": [3000, 8080],
-                "emoji": "🟢",
-                "patterns": ["package.json", "node_modules/"],
-            },
+        file_index = self._get_file_index()
+        return [
             {
-                "name": "Web",
-                "ports": [8080, 3000, 5173],
-                "emoji": "🌐",
-                "patterns": ["index.html", "*.css", "*.js"],
-            },
-            {
-                "name": "Docker",
-                "ports": [80, 443, 8080],
-                "emoji": "🐳",
-                "patterns": ["docker-compose.yml", "Dockerfile"],
-            },
-            {
-                "name": "Database",
-                "ports": [5432, 3306, 27017],
-                "emoji": "🗄️",
-                "patterns": ["*.sql", "migrations/"],
-            },
+                "name": pattern.name,
+                "ports": list(pattern.ports),
+                "emoji": pattern.emoji,
+                "enabled": True,
+            }
+            for pattern in SERVER_PATTERNS
+            if pattern.matches(file_index)
         ]
 
-        for pattern in server_patterns:
-            if self._matches_pattern(pattern["patterns"]):
-                servers.append(
-                    {
-                        "name": pattern["name"],
-                        "ports": pattern["ports"],
-                        "emoji": pattern["emoji"],
-                        "enabled": True,
-                    }
-                )
-
-        return servers
-
-    def _matches_pattern(self, patterns: list[str]) -> bool:
-        """Check if project matches file patterns."""
-        for pattern in patterns:
-            matches = list(self.project_path.rglob(pattern))
-            if matches:
-                return True
-        return False
+    def _get_file_index(self) -> FileIndex:
+        """Get the project file index, walking the tree only on first use."""
+        if self._file_index is None:
+            self._file_index = FileIndex.build(self.project_path)
+        return self._file_index
 
 
 class ServerDetector:
@@ -173,41 +299,62 @@ class ServerDetector:
     def detect_servers(self, server_configs: list[dict[str, Any]]) -> list[dict[str, str | int]]:
         """Detect active servers based on configuration."""
         servers = []
+        active_ports = self._active_ports()
 
         for config in server_configs:
             if not config.get("enabled", True):
                 continue
 
             for port in config["ports"]:
-                if self._is_port_active(port):
+                if port in active_ports:
                     servers.append({"name": config["name"], "port": port, "emoji": config["emoji"]})
                     break  # Only show one instance per server type
 
         return servers
 
-    def _is_port_active(self, port: int) -> bool:
-        """Check if port is active using platform-specific commands."""
-        port_str = str(port)
+    def _active_ports(self) -> frozenset[int]:
+        """Get all listening TCP ports in one pass using platform-specific sources."""
+        if sys.platform.startswith("linux"):
+            ports = self._active_ports_linux()
+            if ports is not None:
+                return ports
+
+        if sys.platform != "win32":
+            # Unix-like: Try lsof first, fallback to netstat
+            output = self._run_command(_LSOF_LISTEN_CMD)
+            if output is not None:
+                return frozenset(int(port) for port in _LSOF_PORT_RE.findall(output))
+
+        output = self._run_command(_NETSTAT_CMD)
+        if output is None:
+            return frozenset()
+        return frozenset(int(port) for port in _NETSTAT_LISTEN_RE.findall(output))
+
+    @staticmethod
+    def _active_ports_linux() -> frozenset[int] | None:
+        """Read listening ports from /proc/net/tcp{,6}, or None if neither is readable."""
+        matches: list[bytes] = []
+        found = False
+
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                # Pseudo-files can't be mmapped; a single read() and one regex pass
+                # keeps the scan out of Python-level line handling
+                with open(table, "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
 
+            found = True
+            matches.extend(_PROC_LISTEN_RE.findall(data))
+
+        return frozenset(int(port, 16) for port in matches) if found else None
+
+    @staticmethod
+    def _run_command(command: Sequence[str]) -> str | None:
+        """Run a port listing command, returning None if it is unavailable."""
         try:
-            if sys.platform == "win32":
-                # Windows: Use netstat
-                result = subprocess.run(
-                    ["netstat", "-an"], capture_output=True, text=True, timeout=2.0
-                )
-                return f":{port_str}" in result.stdout
-            else:
-                # Unix-like: Try lsof first, fallback to netstat
-                try:
-                    result = subprocess.run(
-                        ["lsof", f"-i:{port_str}"], capture_output=True, text=True, timeout=2.0
-                    )
-                    return bool(result.stdout.strip())
-                except (OSError, FileNotFoundError):
-                    # lsof not available, try netstat
-                    result = subprocess.run(
-                        ["netstat", "-an"], capture_output=True, text=True, timeout=2.0
-                    )
-                    return f":{port_str}" in result.stdout
-        except (subprocess.TimeoutExpired, OSError, FileNotFoundError):
-            return False
+            result = subprocess.run(command, capture_output=True, text=True, timeout=2.0)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        return result.stdout
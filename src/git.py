@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .cache import StatusCache
 
-@dataclass(frozen=True)
+# One call reports branch, upstream divergence and worktree changes;
+# --no-optional-locks keeps it from refreshing (and locking) the index
+_GIT_STATUS_CMD = ("git", "--no-optional-locks", "status", "--branch", "--porcelain=v2")
+
+# Each status scans its own worktree, so bound how many run at once (e.g. big monoliths)
+_MAX_RUNNING_STATUS = 8
+
+
+@dataclass(frozen=True, slots=True)
 class RepoStatus:
     """Repository status information."""
 
@@ -19,50 +30,215 @@ class RepoStatus:
     path: str
 
 
+@dataclass(slots=True)
+class _PendingStatus:
+    """A repository whose `git status` process has been started but not collected."""
+
+    repo_config: dict[str, Any]
+    repo_path: Path
+    cache_path: str
+    signature: list[int] | None
+    process: subprocess.Popen[bytes] | None
+
+
+def _is_cached_status(cached: dict[str, Any]) -> bool:
+    """Check a cached status has every field RepoStatus needs, with the right types."""
+    return (
+        isinstance(cached.get("branch"), str)
+        and type(cached.get("behind")) is int
+        and isinstance(cached.get("has_changes"), bool)
+    )
+
+
 class GitManager:
     """Git repository management."""
 
+    def __init__(self, status_cache: StatusCache | None = None):
+        self.status_cache = status_cache
+
+    @staticmethod
+    def head_fingerprint(repo_path: str) -> str:
+        """Get HEAD and the ref it points to, read straight from .git without spawning git."""
+        git_dir = Path(repo_path) / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return ""
+
+        if head.startswith("ref: "):
+            try:
+                return f"{head}@{(git_dir / head[5:]).read_text().strip()}"
+            except OSError:
+                # Packed or unborn ref; HEAD alone still tracks branch switches
+                pass
+        return head
+
     @staticmethod
-    def run_git_command(cmd_args: list[str], cwd: str) -> tuple[str, bool]:
-        """Run git command safely and return output and success status."""
+    def _fast_head(repo_path: Path) -> str | None:
+        """Get branch name (or short hash when detached) by reading .git/HEAD directly."""
         try:
-            result = subprocess.run(cmd_args, capture_output=True, text=True, cwd=cwd, timeout=5.0)
-            return result.stdout.strip(), result.returncode == 0
-        except (subprocess.TimeoutExpired, OSError, FileNotFoundError):
-            return "", False
+            head = (repo_path / ".git" / "HEAD").read_text().strip()
+        except OSError:
+            return None
+
+        if head.startswith("ref: refs/heads/"):
+            return head[16:]
+        if len(head) >= 40 and all(c in "0123456789abcdef" for c in head):
+            return head[:7]
+        return None
 
     def get_repo_status(self, repo_config: dict[str, Any], project_root: str) -> RepoStatus | None:
         """Get status for a single repository."""
+        pending = self._start_repo_status(repo_config, project_root)
+        if isinstance(pending, _PendingStatus):
+            return self._finish_repo_status(pending)
+        return pending
+
+    def get_repo_statuses(
+        self, repo_configs: list[dict[str, Any]], project_root: str
+    ) -> list[RepoStatus]:
+        """Get status for several repositories, running their git processes side by side."""
+        statuses: list[RepoStatus | _PendingStatus | None] = []
+        running: deque[int] = deque()
+
+        # Keep up to _MAX_RUNNING_STATUS git processes going so their runtimes overlap;
+        # once the window is full, collect the oldest before starting the next
+        for config in repo_configs:
+            if len(running) >= _MAX_RUNNING_STATUS:
+                self._collect(statuses, running.popleft())
+            status = self._start_repo_status(config, project_root)
+            if isinstance(status, _PendingStatus):
+                running.append(len(statuses))
+            statuses.append(status)
+
+        while running:
+            self._collect(statuses, running.popleft())
+
+        if self.status_cache:
+            self.status_cache.save()
+
+        return [status for status in statuses if status]
+
+    def _collect(self, statuses: list[RepoStatus | _PendingStatus | None], index: int) -> None:
+        """Replace a pending status in the list with its finished result."""
+        pending = statuses[index]
+        if isinstance(pending, _PendingStatus):
+            statuses[index] = self._finish_repo_status(pending)
+
+    def _start_repo_status(
+        self, repo_config: dict[str, Any], project_root: str
+    ) -> RepoStatus | _PendingStatus | None:
+        """Return a cached status, or spawn `git status` and return it as pending."""
         repo_path = Path(project_root) / repo_config["path"]
 
-        if not repo_path.exists() or not (repo_path / ".git").exists():
+        # A readable .git/HEAD already proves the repository exists; only worktrees and
+        # submodules (where .git is a file) need their own existence check
+        signature = self._status_signature(repo_path)
+        if signature is None and not os.path.exists(repo_path / ".git"):
             return None
 
-        # Get branch name
-        branch_output, branch_success = self.run_git_command(
-            ["git", "symbolic-ref", "--short", "HEAD"], str(repo_path)
-        )
-        if not branch_success:
-            # Fallback to short hash if not on a branch
-            branch_output, _ = self.run_git_command(
-                ["git", "rev-parse", "--short", "HEAD"], str(repo_path)
+        # Reuse a recent status while HEAD, the index and fetched refs are untouched
+        cache_path = os.path.abspath(repo_path)
+        if self.status_cache and signature:
+            cached = self.status_cache.get(cache_path, signature)
+            if cached and _is_cached_status(cached):
+                return RepoStatus(
+                    name=repo_config["name"],
+                    branch=cached["branch"],
+                    behind=cached["behind"],
+                    has_changes=cached["has_changes"],
+                    path=repo_config["path"],
+                )
+
+        try:
+            process = subprocess.Popen(
+                _GIT_STATUS_CMD,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+                cwd=repo_path,
             )
-        branch_name = branch_output or "detached"
+        except OSError:
+            process = None
 
-        # Get commits behind upstream
-        behind_output, success = self.run_git_command(
-            ["git", "rev-list", "--count", "HEAD..@{u}"], str(repo_path)
-        )
-        behind = int(behind_output) if success and behind_output.isdigit() else 0
+        return _PendingStatus(repo_config, repo_path, cache_path, signature, process)
+
+    def _finish_repo_status(self, pending: _PendingStatus) -> RepoStatus:
+        """Wait for a pending `git status` and build the repository status from it."""
+        status_output, success = b"", False
+        if pending.process:
+            try:
+                status_output, _ = pending.process.communicate(timeout=5.0)
+                success = pending.process.returncode == 0
+            except subprocess.TimeoutExpired:
+                pending.process.kill()
+                pending.process.communicate()
 
-        # Check for uncommitted changes
-        changes_output, _ = self.run_git_command(["git", "status", "--porcelain"], str(repo_path))
-        has_changes = bool(changes_output.strip())
+        if success:
+            branch_name, behind, has_changes = self._parse_porcelain_v2(status_output)
+        else:
+            # git missing or failing: HEAD on disk still names the branch
+            branch_name = self._fast_head(pending.repo_path) or "detached"
+            behind, has_changes = 0, False
+
+        if self.status_cache and pending.signature and success:
+            self.status_cache.set(
+                pending.cache_path,
+                pending.signature,
+                {"branch": branch_name, "behind": behind, "has_changes": has_changes},
+            )
 
         return RepoStatus(
-            name=repo_config["name"],
+            name=pending.repo_config["name"],
             branch=branch_name,
             behind=behind,
             has_changes=has_changes,
-            path=repo_config["path"],
+            path=pending.repo_config["path"],
         )
+
+    @staticmethod
+    def _status_signature(repo_path: Path) -> list[int] | None:
+        """Get HEAD, index and FETCH_HEAD mtimes, which change on commits, staging and fetches."""
+        git_dir = repo_path / ".git"
+        try:
+            head_stat = os.stat(git_dir / "HEAD")
+        except OSError:
+            # .git is a file for worktrees and submodules; skip caching for those
+            return None
+        # FETCH_HEAD is rewritten by every fetch/pull, which is what moves "behind"
+        signature = [head_stat.st_mtime_ns]
+        for name in ("index", "FETCH_HEAD"):
+            try:
+                signature.append(os.stat(git_dir / name).st_mtime_ns)
+            except OSError:
+                signature.append(0)
+        return signature
+
+    @staticmethod
+    def _parse_porcelain_v2(output: bytes) -> tuple[str, int, bool]:
+        """Parse branch name, commits behind upstream and change state from porcelain v2."""
+        oid = b""
+        head = b""
+        behind = 0
+        has_changes = False
+
+        for line in output.splitlines():
+            if line.startswith(b"# branch.oid "):
+                oid = line[13:]
+            elif line.startswith(b"# branch.head "):
+                head = line[14:]
+            elif line.startswith(b"# branch.ab "):
+                # "# branch.ab +<ahead> -<behind>"
+                behind_field = line.rsplit(b" ", 1)[-1].lstrip(b"-")
+                behind = int(behind_field) if behind_field.isdigit() else 0
+            elif line and not line.startswith(b"#"):
+                # Entries always follow the branch headers, so the first one settles it
+                has_changes = True
+                break
+
+        if head == b"(detached)":
+            # Fallback to short hash if not on a branch
+            head = oid[:7] if oid and oid != b"(initial)" else b""
+
+        # Only the branch name is decoded; everything else is compared as bytes
+        return head.decode("utf-8", "replace") or "detached", behind, has_changes
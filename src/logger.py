@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-import logging
 import os
 import sys
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import logging
+
+# Same values as the logging module, so level checks work without importing it
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
 
 
 class StatusLineLogger:
@@ -15,12 +21,19 @@ class StatusLineLogger:
     def __init__(self, name: str = "cc-status-line", config: dict[str, Any] | None = None):
         self.name = name
         self.config = config or {}
-        self.logger = self._setup_logger()
+        self.level = self._get_log_level()
+
+    @cached_property
+    def logger(self) -> logging.Logger:
+        """Underlying logger, only set up once a message passes the level check."""
+        return self._setup_logger()
 
     def _setup_logger(self) -> logging.Logger:
         """Set up logger with appropriate handlers and formatters."""
+        import logging
+
         logger = logging.getLogger(self.name)
-        logger.setLevel(self._get_log_level())
+        logger.setLevel(self.level)
 
         # Clear any existing handlers
         logger.handlers.clear()
@@ -38,16 +51,16 @@ class StatusLineLogger:
         """Get log level from environment or config."""
         # 1. Environment variable
         env_level = os.getenv("CCSL_LOG_LEVEL", "").upper()
-        if env_level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            return getattr(logging, env_level)
+        if env_level in _LEVELS:
+            return _LEVELS[env_level]
 
         # 2. Configuration
         config_level = self.config.get("logging", {}).get("level", "WARNING").upper()
-        if config_level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            return getattr(logging, config_level)
+        if config_level in _LEVELS:
+            return _LEVELS[config_level]
 
         # 3. Default to WARNING (errors and above only)
-        return logging.WARNING
+        return _LEVELS["WARNING"]
 
     def _should_log_to_file(self) -> bool:
         """Check if file logging is enabled."""
@@ -95,6 +108,8 @@ class StatusLineLogger:
 
     def _create_file_handler(self) -> logging.Handler:
         """Create file handler with rotation."""
+        import logging
+
         log_file = self._get_log_file_path()
 
         # Ensure log directory exists
@@ -119,6 +134,8 @@ class StatusLineLogger:
 
     def _create_stderr_handler(self) -> logging.Handler:
         """Create stderr handler for debugging."""
+        import logging
+
         handler = logging.StreamHandler(sys.stderr)
 
         formatter = logging.Formatter("[%(levelname)s] %(name)s: %(message)s")
@@ -128,27 +145,33 @@ class StatusLineLogger:
 
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message."""
-        self.logger.debug(message, **kwargs)
+        if self.level <= _LEVELS["DEBUG"]:
+            self.logger.debug(message, **kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log info message."""
-        self.logger.info(message, **kwargs)
+        if self.level <= _LEVELS["INFO"]:
+            self.logger.info(message, **kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message."""
-        self.logger.warning(message, **kwargs)
+        if self.level <= _LEVELS["WARNING"]:
+            self.logger.warning(message, **kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log error message."""
-        self.logger.error(message, **kwargs)
+        if self.level <= _LEVELS["ERROR"]:
+            self.logger.error(message, **kwargs)
 
     def critical(self, message: str, **kwargs: Any) -> None:
         """Log critical message."""
-        self.logger.critical(message, **kwargs)
+        if self.level <= _LEVELS["CRITICAL"]:
+            self.logger.critical(message, **kwargs)
 
     def exception(self, message: str, **kwargs: Any) -> None:
         """Log exception with traceback."""
-        self.logger.exception(message, **kwargs)
+        if self.level <= _LEVELS["ERROR"]:
+            self.logger.exception(message, **kwargs)
 
 
 def get_logger(
@@ -3,45 +3,92 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 from typing import Any
 
 from .git import RepoStatus
 
+# ANSI color codes
+_RESET = "\033[0m"
+_ANSI_CODES = {
+    "reset": _RESET,
+    "green": "\033[32m",
+    "yellow": "\033[33m",
+    "red": "\033[31m",
+    "blue": "\033[34m",
+    "magenta": "\033[35m",
+    "cyan": "\033[36m",
+    "white": "\033[37m",
+    "bright_green": "\033[92m",
+    "bright_yellow": "\033[93m",
+    "bright_red": "\033[91m",
+    "bright_blue": "\033[94m",
+    "bright_magenta": "\033[95m",
+    "bright_cyan": "\033[96m",
+    "dim": "\033[2m",
+}
+
+# Branch name prefix -> color; "feat" also covers "feature", "dev" covers "develop"
+_BRANCH_PREFIX_RE = re.compile(r"feat|hotfix|bugfix|fix|dev|release")
+_BRANCH_PREFIX_COLORS = {
+    "feat": "bright_blue",
+    "fix": "bright_red",
+    "hotfix": "bright_red",
+    "bugfix": "bright_red",
+    "dev": "bright_yellow",
+    "release": "bright_magenta",
+}
+# Long-lived branch names resolve with one dict lookup before any prefix matching
+_BRANCH_EXACT_COLORS = {
+    "main": "bright_green",
+    "master": "bright_green",
+    "develop": "bright_yellow",
+}
+
+# (has_changes, behind > 5, behind > 0) -> status emoji; local changes take precedence
+_STATUS_EMOJI = {
+    (True, True, True): "🟡",
+    (True, False, True): "🟡",
+    (True, False, False): "🟡",
+    (False, True, True): "🔴",
+    (False, False, True): "⚠️",
+    (False, False, False): "✅",
+}
+
+
+def _no_color_set() -> bool:
+    """Check the NO_COLOR convention (https://no-color.org); any non-empty value disables color."""
+    return bool(os.environ.get("NO_COLOR"))
+
+
+@lru_cache(maxsize=64)
+def _status_emoji(behind: int, has_changes: bool) -> str:
+    """Get status emoji; cached since behind counts repeat across repos and renders."""
+    return _STATUS_EMOJI[(has_changes, behind > 5, behind > 0)]
+
 
 class StatusLineRenderer:
     """Render status line output."""
 
     # ANSI color codes
-    COLORS = {
-        "reset": "\033[0m",
-        "green": "\033[32m",
-        "yellow": "\033[33m",
-        "red": "\033[31m",
-        "blue": "\033[34m",
-        "magenta": "\033[35m",
-        "cyan": "\033[36m",
-        "white": "\033[37m",
-        "bright_green": "\033[92m",
-        "bright_yellow": "\033[93m",
-        "bright_red": "\033[91m",
-        "bright_blue": "\033[94m",
-        "bright_magenta": "\033[95m",
-        "bright_cyan": "\033[96m",
-        "dim": "\033[2m",
-    }
+    COLORS = _ANSI_CODES
 
     def __init__(self, config: dict[str, Any]):
         self.config = config
-        self.use_colors = config.get("output_format", {}).get("colors", True) and not os.getenv(
-            "NO_COLOR"
-        )
-        self.multiline = config.get("output_format", {}).get("multiline", True)
+        output_format = config.get("output_format", {})
+        self.use_colors = output_format.get("colors", True) and not _no_color_set()
+        self.multiline = output_format.get("multiline", True)
+
+        # Escape codes are spliced straight into the render f-strings, so the color choice
+        # is made once here; without colors every code is an empty string
+        self._codes = _ANSI_CODES if self.use_colors else dict.fromkeys(_ANSI_CODES, "")
 
     def _colorize(self, text: str, color: str) -> str:
         """Apply ANSI color to text if colors are enabled."""
-        if not self.use_colors or color not in self.COLORS:
+        if not self.use_colors or color not in _ANSI_CODES:
             return text
-        return f"{self.COLORS[color]}{text}{self.COLORS['reset']}"
+        return f"{_ANSI_CODES[color]}{text}{_RESET}"
 
     def render(self, repos: list[RepoStatus], servers: list[dict[str, Any]]) -> list[str]:
         """Render complete status line."""
@@ -68,52 +115,44 @@ class StatusLineRenderer:
 
     def _render_repositories(self, repos: list[RepoStatus]) -> str:
         """Render repository status line."""
-        repo_parts = []
-
-        for repo in repos:
-            status_emoji = self._get_status_emoji(repo.behind, repo.has_changes)
-            behind_text = self._colorize(f"-{repo.behind}", "red") if repo.behind > 0 else ""
-            changes_marker = self._colorize("*", "yellow") if repo.has_changes else ""
-            branch_colored = self._colorize(repo.branch, self._get_branch_color(repo.branch))
-            repo_name_colored = self._colorize(repo.name, "bright_cyan")
-
-            repo_part = (
-                f"{status_emoji}{repo_name_colored}:{branch_colored}{behind_text}{changes_marker}"
-            )
-            repo_parts.append(repo_part)
+        codes = self._codes
+        reset, red = codes["reset"], codes["red"]
+        # The repo name prefix and change marker are the same for every repo
+        name_start = codes["bright_cyan"]
+        changed = f"{codes['yellow']}*{reset}"
+
+        repo_parts = [
+            f"{_status_emoji(repo.behind, repo.has_changes)}{name_start}{repo.name}{reset}:"
+            f"{codes[self._get_branch_color(repo.branch)]}{repo.branch}{reset}"
+            f"{f'{red}-{repo.behind}{reset}' if repo.behind > 0 else ''}"
+            f"{changed if repo.has_changes else ''}"
+            for repo in repos
+        ]
 
         return f"📂 Repos ▶ {' │ '.join(repo_parts)}"
 
     def _render_servers(self, servers: list[dict[str, Any]]) -> str:
         """Render server status line."""
-        server_parts = []
+        codes = self._codes
+        reset = codes["reset"]
+        name_start, port_start = codes["bright_green"], codes["bright_yellow"]
 
-        for server in servers:
-            server_name_colored = self._colorize(server["name"], "bright_green")
-            port_colored = self._colorize(str(server["port"]), "bright_yellow")
-            server_parts.append(f"{server['emoji']}{server_name_colored}:{port_colored}")
+        server_parts = [
+            f"{server['emoji']}{name_start}{server['name']}{reset}:"
+            f"{port_start}{server['port']}{reset}"
+            for server in servers
+        ]
 
         return f"🖥️ Servers ▶ {' │ '.join(server_parts)}"
 
     def _get_branch_color(self, branch_name: str) -> str:
         """Get color for branch name based on branch type."""
-        if branch_name in ("main", "master"):
-            return "bright_green"
-        elif branch_name.startswith(("feat", "feature")):
-            return "bright_blue"
-        elif branch_name.startswith(("fix", "hotfix", "bugfix")):
-            return "bright_red"
-        elif branch_name.startswith(("dev", "develop")):
-            return "bright_yellow"
-        elif branch_name.startswith("release"):
-            return "bright_magenta"
+        if color := _BRANCH_EXACT_COLORS.get(branch_name):
+            return color
+        if match := _BRANCH_PREFIX_RE.match(branch_name):
+            return _BRANCH_PREFIX_COLORS[match.group()]
         return "cyan"
 
     def _get_status_emoji(self, behind: int, has_changes: bool) -> str:
         """Get appropriate status emoji."""
-        if has_changes:
-            return "🟡"
-        elif behind > 0:
-            return "🔴" if behind > 5 else "⚠️"
-        else:
-            return "✅"
+        return _status_emoji(behind, has_changes)
@@ -2,24 +2,65 @@
 
 from __future__ import annotations
 
-import time
-from typing import Any
+import re
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from .config import ConfigManager
 from .detection import ProjectDetector
 
+if TYPE_CHECKING:
+    from .config import ConfigManager
+
+# (project type, description) in the order the wizard lists them
+_PROJECT_TYPE_ROWS: tuple[tuple[str, str], ...] = (
+    ("monolith", "Monolith with git submodules"),
+    ("single", "Single git repository"),
+    ("multi", "Multiple repositories in workspace"),
+    ("custom", "Custom configuration"),
+)
+
+# Prompt validators are stateless, so one instance serves every prompt
+_PROJECT_TYPE_RANGE = click.IntRange(1, len(_PROJECT_TYPE_ROWS))
+_REPO_TYPES = ("main", "submodule", "repository")
+_REPO_TYPE_CHOICE = click.Choice(_REPO_TYPES)
+
+_PORTS_SPLIT_RE = re.compile(r"[,\s]+")
+
+_REPO_FIELDS = itemgetter("name", "path", "type")
+
 
 class SetupWizard:
     """Interactive setup wizard for project configuration."""
 
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, assume_yes: bool = False):
         self.config_manager = config_manager
+        self.assume_yes = assume_yes
         self.detector = ProjectDetector(self.config_manager._find_git_root() or ".")
 
+    def _prompt(self, text: str, **kwargs: Any) -> Any:
+        """Prompt for a value, or take the default when running with --yes."""
+        if self.assume_yes and "default" in kwargs:
+            return kwargs["default"]
+        return click.prompt(text, **kwargs)
+
+    def _plain_prompt(self, text: str) -> str:
+        """Read free text where blank means done; nothing to validate, so skip click."""
+        if self.assume_yes:
+            return ""
+        return input(f"{text}: ").strip()
+
+    def _confirm(self, text: str, default: bool) -> bool:
+        """Ask a yes/no question, or take the default when running with --yes."""
+        if self.assume_yes:
+            return default
+        return click.confirm(text, default=default)
+
     def run_setup(self) -> dict[str, Any]:
         """Run interactive setup wizard."""
+        import time
+
         click.echo("🚀 CC Status Line Setup Wizard")
         click.echo("===============================")
 
@@ -47,6 +88,7 @@ class SetupWizard:
         self._configure_claude_code()
 
         # Create config dictionary
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
         config = {
             "name": name,
             "type": project_type,
@@ -55,8 +97,8 @@ class SetupWizard:
             "servers": servers,
             "output_format": output_format,
             "system_monitoring": system_monitoring,
-            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "created_at": now,
+            "updated_at": now,
         }
 
         return config
@@ -64,7 +106,7 @@ class SetupWizard:
     def _get_project_name(self) -> str:
         """Get project name from user."""
         suggested_name = self.detector.project_path.name
-        return click.prompt("📋 Project name", default=suggested_name, show_default=True)
+        return self._prompt("📋 Project name", default=suggested_name, show_default=True)
 
     def _get_project_type(self) -> str:
         """Get project type from user."""
@@ -72,27 +114,25 @@ class SetupWizard:
 
         click.echo(f"🔍 Detected project type: {detected_type}")
 
-        types = ["monolith", "single", "multi", "custom"]
-        type_descriptions = {
-            "monolith": "Monolith with git submodules",
-            "single": "Single git repository",
-            "multi": "Multiple repositories in workspace",
-            "custom": "Custom configuration",
-        }
-
-        click.echo("\nAvailable project types:")
-        for i, ptype in enumerate(types, 1):
-            marker = "👈" if ptype == detected_type else "  "
-            click.echo(f"  {i}. {ptype} - {type_descriptions[ptype]} {marker}")
-
-        choice = click.prompt(
+        # Build the listing as one block so it is written with a single echo
+        lines = ["\nAvailable project types:"]
+        detected_choice = 1
+        for i, (ptype, description) in enumerate(_PROJECT_TYPE_ROWS, 1):
+            marker = "  "
+            if ptype == detected_type:
+                marker = "👈"
+                detected_choice = i
+            lines.append(f"  {i}. {ptype} - {description} {marker}")
+        click.echo("\n".join(lines))
+
+        choice = self._prompt(
             "Select project type",
-            type=click.IntRange(1, len(types)),
-            default=types.index(detected_type) + 1,
+            type=_PROJECT_TYPE_RANGE,
+            default=detected_choice,
             show_default=True,
         )
 
-        return types[choice - 1]
+        return _PROJECT_TYPE_ROWS[choice - 1][0]
 
     def _configure_repositories(self, project_type: str) -> list[dict[str, Any]]:
         """Configure repositories interactively."""
@@ -100,15 +140,21 @@ class SetupWizard:
 
         click.echo(f"\n📂 Repository Configuration ({len(suggested_repos)} detected)")
 
-        if suggested_repos and click.confirm("Use detected repositories?", default=True):
+        if suggested_repos and self._confirm("Use detected repositories?", default=True):
             repositories = suggested_repos
         else:
             repositories = self._manual_repo_config()
 
         # Show final configuration
-        click.echo("\n📂 Final repository configuration:")
-        for repo in repositories:
-            click.echo(f"  • {repo['name']}: {repo['path']} ({repo['type']})")
+        click.echo(
+            "\n".join(
+                ["\n📂 Final repository configuration:"]
+                + [
+                    f"  • {name}: {path} ({repo_type})"
+                    for name, path, repo_type in map(_REPO_FIELDS, repositories)
+                ]
+            )
+        )
 
         return repositories
 
@@ -116,17 +162,28 @@ class SetupWizard:
         """Manual repository configuration."""
         repositories = []
 
-        click.echo("Enter repositories (press Enter with empty name to finish):")
+        click.echo("Enter repositories (press Enter with empty name to finish).")
+        click.echo("Use NAME:PATH:TYPE to add one in a single line, or just NAME to be asked.")
         while True:
             try:
-                name = click.prompt("Repository name", default="", show_default=False)
+                name = self._plain_prompt("Repository")
                 if not name:
                     break
 
+                if ":" in name:
+                    repo = self._parse_repo_line(name)
+                    if repo:
+                        repositories.append(repo)
+                    else:
+                        click.echo(
+                            f"⚠️  Expected NAME:PATH:TYPE with TYPE one of {', '.join(_REPO_TYPES)}"
+                        )
+                    continue
+
                 path = click.prompt("Repository path", default=".")
                 repo_type = click.prompt(
                     "Repository type",
-                    type=click.Choice(["main", "submodule", "repository"]),
+                    type=_REPO_TYPE_CHOICE,
                     default="repository",
                 )
 
@@ -136,6 +193,30 @@ class SetupWizard:
 
         return repositories
 
+    @staticmethod
+    def _parse_repo_line(line: str) -> dict[str, Any] | None:
+        """Parse a NAME:PATH:TYPE repository entry, or None if it is malformed."""
+        # Split the name off the front and the type off the back so Windows
+        # drive letters ("C:\\src") survive inside the path
+        name, _, rest = line.partition(":")
+        path, _, repo_type = rest.rpartition(":")
+        name, path, repo_type = name.strip(), path.strip(), repo_type.strip()
+        if not name or not path or repo_type not in _REPO_TYPES:
+            return None
+        return {"name": name.upper(), "path": path, "type": repo_type}
+
+    @staticmethod
+    def _parse_ports(ports_str: str) -> list[int] | None:
+        """Parse a comma- or space-separated port list, or None if any entry is invalid."""
+        tokens = [token for token in _PORTS_SPLIT_RE.split(ports_str) if token]
+        # isdigit() alone accepts non-ASCII digits such as "³", so check ASCII too
+        if not tokens or not all(token.isascii() and token.isdigit() for token in tokens):
+            return None
+        ports = [int(token) for token in tokens]
+        if not all(1 <= port <= 65535 for port in ports):
+            return None
+        return ports
+
     def _configure_servers(self) -> list[dict[str, Any]]:
         """Configure server detection."""
         suggested_servers = self.detector.suggest_servers()
@@ -143,11 +224,17 @@ class SetupWizard:
         click.echo(f"\n🖥️  Server Detection ({len(suggested_servers)} detected)")
 
         if suggested_servers:
-            click.echo("Detected servers:")
-            for server in suggested_servers:
-                click.echo(f"  • {server['emoji']} {server['name']}: ports {server['ports']}")
+            click.echo(
+                "\n".join(
+                    ["Detected servers:"]
+                    + [
+                        f"  • {server['emoji']} {server['name']}: ports {server['ports']}"
+                        for server in suggested_servers
+                    ]
+                )
+            )
 
-            if click.confirm("Use detected servers?", default=True):
+            if self._confirm("Use detected servers?", default=True):
                 return suggested_servers
 
         return self._manual_server_config()
@@ -159,17 +246,15 @@ class SetupWizard:
         click.echo("Enter server configurations (press Enter with empty name to finish):")
         while True:
             try:
-                name = click.prompt("Server name", default="", show_default=False)
+                name = self._plain_prompt("Server name")
                 if not name:
                     break
 
                 ports_str = click.prompt("Ports (comma-separated)", default="3000,8000")
-                try:
-                    ports = [int(p.strip()) for p in ports_str.split(",") if p.strip()]
-                    if not ports:
-                        ports = [3000]
-                except ValueError:
-                    click.echo("⚠️  Invalid port format, using default [3000]")
+                ports = self._parse_ports(ports_str)
+                if not ports:
+                    if ports_str.strip():
+                        click.echo("⚠️  Invalid port format, using default [3000]")
                     ports = [3000]
 
                 emoji = click.prompt("Emoji", default="🖥️")
@@ -184,9 +269,9 @@ class SetupWizard:
         """Configure output formatting."""
         click.echo("\n🎨 Output Format Configuration")
 
-        multiline = click.confirm("Use multiline output?", default=True)
-        colors = click.confirm("Enable colors?", default=True)
-        compact = click.confirm("Use compact mode?", default=False)
+        multiline = self._confirm("Use multiline output?", default=True)
+        colors = self._confirm("Enable colors?", default=True)
+        compact = self._confirm("Use compact mode?", default=False)
 
         return {
             "multiline": multiline,
@@ -200,7 +285,7 @@ class SetupWizard:
         """Configure system monitoring."""
         click.echo("\n📊 System Monitoring Configuration")
 
-        enabled = click.confirm("Enable system monitoring?", default=False)
+        enabled = self._confirm("Enable system monitoring?", default=False)
 
         return {"enabled": enabled, "battery": enabled, "cpu": enabled, "memory": enabled}
 
@@ -212,35 +297,40 @@ class SetupWizard:
         click.echo("\n⚡ Claude Code Integration")
         click.echo("💡 You can also run '/statusline' command in Claude Code for interactive setup")
 
-        setup_claude = click.confirm("Set up Claude Code status line integration?", default=True)
+        setup_claude = self._confirm("Set up Claude Code status line integration?", default=True)
         if not setup_claude:
             click.echo("👍 Skipping Claude Code setup")
             return
 
         # Find or create Claude Code settings
-        claude_settings_paths = [
+        claude_settings_paths = (
             Path.cwd() / ".claude" / "settings.json",  # Project-specific
             Path.home() / ".claude" / "settings.json",  # Global
-        ]
+        )
+
+        if self.assume_yes:
+            # Never touch the global settings without asking; --yes only writes the project file
+            claude_settings_paths = claude_settings_paths[:1]
 
         # Try to find existing settings
         existing_settings = None
         settings_path = None
 
         for path in claude_settings_paths:
-            if path.exists():
-                try:
-                    with open(path) as f:
-                        existing_settings = json.load(f)
-                    settings_path = path
-                    click.echo(f"📁 Found existing Claude Code settings: {path}")
-                    break
-                except (OSError, json.JSONDecodeError):
-                    continue
+            try:
+                # A missing file is just an OSError here, no separate exists() probe
+                existing_settings = json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            settings_path = path
+            click.echo(f"📁 Found existing Claude Code settings: {path}")
+            break
 
         if not settings_path:
             # Ask where to create settings
-            use_local = click.confirm("Create project-specific Claude Code settings?", default=True)
+            use_local = self.assume_yes or self._confirm(
+                "Create project-specific Claude Code settings?", default=True
+            )
             if use_local:
                 settings_path = claude_settings_paths[0]
                 settings_path.parent.mkdir(exist_ok=True)
@@ -254,18 +344,17 @@ class SetupWizard:
 
         # Configure status line
         command = "uvx --from git+https://github.com/ashwch/cc-status-line cc-status-line"
-        existing_settings["statusLine"] = {"type": "command", "command": command, "padding": 0}
+        status_line = {"type": "command", "command": command, "padding": 0}
+        existing_settings["statusLine"] = status_line
 
         # Save settings
         try:
             with open(settings_path, "w") as f:
-                json.dump(existing_settings, f, indent=2)
+                f.write(json.dumps(existing_settings, indent=2))
             click.echo(f"✅ Claude Code settings saved to: {settings_path}")
             click.echo("🚀 Claude Code status line is now configured!")
             click.echo("\n💡 Restart Claude Code to see the new status line")
         except OSError as e:
             click.echo(f"❌ Failed to save Claude Code settings: {e}")
             click.echo(f"💡 Manually add this to {settings_path}:")
-            click.echo(
-                json.dumps({"statusLine": {"type": "command", "command": command}}, indent=2)
-            )
+            click.echo(json.dumps({"statusLine": status_line}, indent=2))
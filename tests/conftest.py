@@ -0,0 +1,26 @@
+"""Shared pytest configuration for CC Status Line tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the `src` package importable however pytest was invoked
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _no_status_cache(monkeypatch):
+    """Keep tests from reading or writing the user's status line cache."""
+    monkeypatch.setenv("CCSL_NO_CACHE", "1")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_git_config(monkeypatch, tmp_path_factory):
+    """Keep the user's global and system git config out of tests."""
+    global_config = tmp_path_factory.mktemp("git") / "gitconfig"
+    global_config.touch()
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
@@ -0,0 +1,95 @@
+"""Tests for status line caching."""
+
+import json
+
+from src.cache import RenderCache, StatusCache
+
+
+class TestRenderCache:
+    """Test the rendered status line cache."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test cached lines are returned for the same key."""
+        cache = RenderCache(cache_dir=tmp_path)
+        key = RenderCache.make_key("/work/app", "app-id", (1, 2))
+
+        cache.set("/work/app", key, ["📂 Repos ▶ ✅APP:main"])
+        assert cache.get("/work/app", key) == ["📂 Repos ▶ ✅APP:main"]
+
+    def test_key_mismatch_misses(self, tmp_path):
+        """Test a changed fingerprint invalidates the entry."""
+        cache = RenderCache(cache_dir=tmp_path)
+        cache.set("/work/app", RenderCache.make_key("old"), ["old"])
+
+        assert cache.get("/work/app", RenderCache.make_key("new")) is None
+
+    def test_expired_entry_misses(self, tmp_path):
+        """Test entries older than the TTL are ignored."""
+        cache = RenderCache(cache_dir=tmp_path, ttl=-1)
+        key = RenderCache.make_key("app")
+        cache.set("/work/app", key, ["line"])
+
+        assert cache.get("/work/app", key) is None
+
+    def test_one_file_per_project(self, tmp_path):
+        """Test re-rendering a project overwrites its cache file."""
+        cache = RenderCache(cache_dir=tmp_path)
+        cache.set("/work/app", RenderCache.make_key("a"), ["a"])
+        cache.set("/work/app", RenderCache.make_key("b"), ["b"])
+
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_malformed_entry_misses(self, tmp_path):
+        """Test a cache file with unexpected field types is treated as a miss."""
+        cache = RenderCache(cache_dir=tmp_path)
+        key = RenderCache.make_key("/work/app")
+        cache.set("/work/app", key, ["line"])
+        cache_file = next(tmp_path.iterdir())
+        for entry in (
+            {"key": key, "created": "yesterday", "lines": ["line"]},
+            {"key": key, "created": 1e18, "lines": [1, 2]},
+            ["not", "a", "dict"],
+        ):
+            cache_file.write_text(json.dumps(entry))
+            assert cache.get("/work/app", key) is None
+
+
+class TestStatusCache:
+    """Test the persisted git status cache."""
+
+    def test_roundtrip_across_instances(self, tmp_path):
+        """Test saved status is reused by a new process-level cache."""
+        cache_file = tmp_path / "status.json"
+        status = {"branch": "main", "behind": 0, "has_changes": False}
+
+        cache = StatusCache(cache_file=cache_file)
+        cache.set("/work/app", [1, 2], status)
+        cache.save()
+
+        assert StatusCache(cache_file=cache_file).get("/work/app", [1, 2]) == status
+
+    def test_signature_change_misses(self, tmp_path):
+        """Test a new HEAD or index mtime invalidates the entry."""
+        cache = StatusCache(cache_file=tmp_path / "status.json")
+        cache.set("/work/app", [1, 2], {"branch": "main", "behind": 0, "has_changes": False})
+
+        assert cache.get("/work/app", [1, 3]) is None
+
+    def test_malformed_entries_miss(self, tmp_path):
+        """Test entries with unexpected field types are misses and dropped on save."""
+        cache_file = tmp_path / "status.json"
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "/work/bad-created": {"signature": [1], "created": None, "status": {}},
+                    "/work/bad-status": {"signature": [1], "created": 1e18, "status": "main"},
+                }
+            )
+        )
+        cache = StatusCache(cache_file=cache_file)
+
+        assert cache.get("/work/bad-created", [1]) is None
+        assert cache.get("/work/bad-status", [1]) is None
+        cache.set("/work/app", [1], {"branch": "main", "behind": 0, "has_changes": False})
+        cache.save()
+        assert "/work/bad-created" not in json.loads(cache_file.read_text())
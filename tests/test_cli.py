@@ -1,16 +1,21 @@
 """Tests for CLI functionality."""
 
 import json
+import os
 import sys
-from pathlib import Path
+import time
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from src import cli
+from src.cli import main
 
-from cli import main
+# Minimal stdin payload Claude Code sends to status line commands
+_CLAUDE_STDIN_JSON = json.dumps(
+    {"session_id": "test", "workspace": {"current_working_directory": "/test/path"}}
+)
 
 
 class TestCLI:
@@ -30,7 +35,7 @@ class TestCLI:
         assert result.exit_code == 0
         assert "CC Status Line, version 1.0.0" in result.output
 
-    @patch("cli.ConfigManager")
+    @patch("src.cli.ConfigManager")
     def test_config_info_command(self, mock_config):
         """Test --config-info command."""
         mock_config.return_value.get_config_info.return_value = {
@@ -51,19 +56,10 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Configuration Information" in result.output
 
-    @patch("sys.stdin.isatty", return_value=False)
-    @patch("sys.stdin.read")
-    @patch("cli.StatusLineEngine")
-    @patch("cli.ConfigManager")
-    def test_claude_code_integration(self, mock_config, mock_engine, mock_stdin, mock_isatty):
+    @patch("src.cli.StatusLineEngine")
+    @patch("src.cli.ConfigManager")
+    def test_claude_code_integration(self, mock_config, mock_engine):
         """Test Claude Code JSON stdin integration."""
-        # Mock stdin with Claude Code JSON
-        claude_context = {
-            "session_id": "test",
-            "workspace": {"current_working_directory": "/test/path"},
-        }
-        mock_stdin.return_value = json.dumps(claude_context)
-
         # Mock configuration
         mock_config.return_value.get_config.return_value = {
             "repositories": [{"name": "TEST", "path": "."}],
@@ -74,16 +70,77 @@ class TestCLI:
         mock_engine.return_value.generate_status_line.return_value = ["📂 Repos ▶ 🟡TEST:main*"]
 
         runner = CliRunner()
-        result = runner.invoke(main, [])
+        result = runner.invoke(main, [], input=_CLAUDE_STDIN_JSON)
         assert result.exit_code == 0
         assert "📂 Repos" in result.output
+        mock_config.return_value.get_config.assert_called_once_with("/test/path")
+
+    @patch("src.cli.StatusLineEngine")
+    @patch("src.cli.ConfigManager")
+    def test_render_cache_skips_second_render(
+        self, mock_config, mock_engine, tmp_path, monkeypatch
+    ):
+        """Test a second invocation within the TTL reuses the cached status line."""
+        monkeypatch.delenv("CCSL_NO_CACHE")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        mock_config.return_value.get_config_fingerprint.return_value = ("/test/path", "test-id")
+        mock_config.return_value.get_config.return_value = {
+            "repositories": [{"name": "TEST", "path": "."}],
+            "servers": [],
+        }
+        mock_engine.return_value.generate_status_line.return_value = ["📂 Repos ▶ 🟡TEST:main*"]
+
+        runner = CliRunner()
+        first = runner.invoke(main, [], input=_CLAUDE_STDIN_JSON)
+        second = runner.invoke(main, [], input=_CLAUDE_STDIN_JSON)
+
+        assert first.exit_code == second.exit_code == 0
+        assert second.output == first.output
+        mock_config.return_value.get_config.assert_called_once()
+        mock_engine.assert_called_once()
 
     def test_no_configuration_error(self):
         """Test behavior when no configuration found."""
-        with patch("cli.ConfigManager") as mock_config:
+        with patch("src.cli.ConfigManager") as mock_config:
             mock_config.return_value.get_config.return_value = {"repositories": [], "servers": []}
 
             runner = CliRunner()
             result = runner.invoke(main, [])
             assert result.exit_code == 0
             assert "No configuration" in result.output
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="select() needs Unix pipes")
+class TestReadStdin:
+    """Test reading piped stdin through a real file descriptor."""
+
+    @pytest.fixture
+    def pipe(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb") as reader:
+            monkeypatch.setattr(sys, "stdin", reader)
+            yield write_fd
+        try:
+            os.close(write_fd)
+        except OSError:
+            pass
+
+    def test_reads_until_writer_closes(self, pipe):
+        """Test the full payload is returned once the writer closes."""
+        os.write(pipe, _CLAUDE_STDIN_JSON.encode())
+        os.close(pipe)
+        assert cli._read_stdin() == _CLAUDE_STDIN_JSON.encode()
+
+    def test_stops_at_size_cap(self, pipe, monkeypatch):
+        """Test reading stops at the size cap even while more data is waiting."""
+        monkeypatch.setattr(cli, "_STDIN_MAX_BYTES", 1024)
+        os.write(pipe, b"x" * 4096)
+        assert cli._read_stdin() == b"x" * 1024
+
+    def test_open_idle_pipe_hits_deadline(self, pipe, monkeypatch):
+        """Test an open pipe with no more data returns after the deadline."""
+        monkeypatch.setattr(cli, "_STDIN_TIMEOUT", 0.05)
+        os.write(pipe, b"{}")
+        start = time.monotonic()
+        assert cli._read_stdin() == b"{}"
+        assert time.monotonic() - start < 1.0
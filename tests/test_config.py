@@ -0,0 +1,239 @@
+"""Tests for configuration management."""
+
+import hashlib
+import shutil
+import subprocess
+
+import pytest
+
+from src.config import ConfigManager
+
+
+def _write_git_config(repo_path, content):
+    git_dir = repo_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(content)
+
+
+class TestGitRemote:
+    """Test git remote resolution for project identification."""
+
+    def test_read_origin_from_git_config(self, tmp_path):
+        """Test origin URL is read from .git/config without spawning git."""
+        _write_git_config(
+            tmp_path,
+            '[core]\n\tbare = false\n[remote "origin"]\n'
+            "\turl = git@github.com:user/repo.git\n"
+            "\tfetch = +refs/heads/*:refs/remotes/origin/*\n",
+        )
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+
+        url = manager._read_git_remote_from_config(str(tmp_path))
+        assert url == "git@github.com:user/repo.git"
+        assert manager.get_project_id(str(tmp_path)) == "github.com-user-repo"
+
+    def test_origin_without_url_does_not_match_other_remote(self, tmp_path):
+        """Test url lookup stays within the origin section."""
+        _write_git_config(
+            tmp_path,
+            '[remote "origin"]\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+            '[remote "upstream"]\n\turl = https://github.com/other/repo.git\n',
+        )
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+
+        assert manager._read_git_remote_from_config(str(tmp_path)) is None
+
+    def test_rewritten_urls_are_left_to_git(self, tmp_path):
+        """Test insteadOf aliases and includes skip the direct .git/config read."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        alias, rewrite = tmp_path / "alias", tmp_path / "rewrite"
+        alias.mkdir()
+        rewrite.mkdir()
+        _write_git_config(alias, '[remote "origin"]\n\turl = gh:user/repo\n')
+        _write_git_config(
+            rewrite,
+            '[url "https://github.com/"]\n\tinsteadOf = git@github.com:\n'
+            '[remote "origin"]\n\turl = git@github.com:user/repo.git\n',
+        )
+
+        assert manager._read_git_remote_from_config(str(alias)) is None
+        assert manager._read_git_remote_from_config(str(rewrite)) is None
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_insteadof_alias_keeps_project_id(self, tmp_path):
+        """Test an insteadOf alias resolves to the same id git remote get-url gives."""
+        git = ["git", "-C", str(tmp_path)]
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        subprocess.run([*git, "config", "url.https://github.com/.insteadOf", "gh:"], check=True)
+        subprocess.run([*git, "remote", "add", "origin", "gh:user/repo"], check=True)
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+
+        assert manager.get_project_id(str(tmp_path)) == "github.com-user-repo"
+
+    def test_global_rewrites_are_left_to_git(self, tmp_path, monkeypatch):
+        """Test insteadOf rules in the global gitconfig skip the direct read."""
+        global_config = tmp_path / "gitconfig"
+        global_config.write_text(
+            '[url "ssh://git@mirror.corp/"]\n\tinsteadOf = https://github.com/\n'
+        )
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+        _write_git_config(tmp_path, '[remote "origin"]\n\turl = https://github.com/me/proj.git\n')
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+
+        assert manager._read_git_remote_from_config(str(tmp_path)) is None
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_global_rewrite_of_full_url_keeps_project_id(self, tmp_path, monkeypatch):
+        """Test a global insteadOf rewrite of a full URL gives the id git itself resolves."""
+        global_config = tmp_path / "gitconfig"
+        global_config.write_text(
+            '[url "ssh://git@mirror.corp/"]\n\tinsteadOf = https://github.com/\n'
+        )
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+        repo = tmp_path / "repo"
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        subprocess.run(
+            ["git", "-C", str(repo), "remote", "add", "origin", "https://github.com/me/proj.git"],
+            check=True,
+        )
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+
+        assert manager.get_project_id(str(repo)) == "ssh-git-mirror.corp-me-proj"
+
+    def test_normalize_https_url(self):
+        """Test https remotes are normalized."""
+        url = ConfigManager._normalize_git_url("https://github.com/user/repo.git")
+        assert url == "github.com/user/repo"
+
+
+class TestYamlLoading:
+    """Test YAML loading and saving."""
+
+    def test_save_and_reload_local_config(self, tmp_path):
+        """Test saved configuration is reloaded after the file changes."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        local_file = tmp_path / ".cc-status-line.yaml"
+
+        manager.save_local_config({"name": "first"}, str(tmp_path))
+        assert manager._load_yaml_file(local_file) == {"name": "first"}
+
+        manager.save_local_config({"name": "second", "type": "single"}, str(tmp_path))
+        assert manager._load_yaml_file(local_file) == {"name": "second", "type": "single"}
+
+    def test_list_projects_does_not_mutate_cached_config(self, tmp_path):
+        """Test list_projects adds ids without touching the loaded config."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        manager.save_project_config({"name": "demo"}, "demo-project")
+
+        projects = manager.list_projects()
+        assert projects[0]["id"] == "demo-project"
+        assert "id" not in manager.get_project_config("demo-project")
+
+    def test_layered_merge_keeps_sources_intact(self, tmp_path):
+        """Test merging layers never writes into the loaded source dicts."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        manager.save_global_config({"logging": {"level": "INFO"}})
+        manager.save_local_config({"logging": {"stderr_enabled": True}}, str(tmp_path))
+
+        config = manager.get_config(str(tmp_path))
+        assert config["logging"] == {"level": "INFO", "stderr_enabled": True}
+        assert config["output_format"]["colors"] is True
+        assert manager._load_yaml_file(manager.global_config_file) == {"logging": {"level": "INFO"}}
+
+    def test_overrides_do_not_leak_into_defaults(self, tmp_path):
+        """Test overriding a default section leaves the built-in defaults untouched."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        manager.save_local_config({"output_format": {"colors": False}}, str(tmp_path))
+
+        assert manager.get_config(str(tmp_path))["output_format"]["colors"] is False
+        assert manager.get_global_config()["output_format"]["colors"] is True
+        assert manager._get_default_global_config()["output_format"]["colors"] is True
+
+    def test_mutating_results_does_not_leak(self, tmp_path):
+        """Test edits to returned configs never reach defaults, cache or later calls."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        manager.save_global_config({"servers": [{"name": "Web", "ports": [3000]}]})
+        manager.save_project_config({"name": "demo", "repositories": []}, "demo-project")
+
+        config = manager.get_global_config()
+        config["output_format"]["colors"] = False
+        config["server_templates"]["web"]["ports"].append(9999)
+        config["servers"][0]["ports"].append(9999)
+        manager.get_project_config("demo-project")["repositories"].append({"name": "X"})
+
+        fresh = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        for checked in (manager, fresh):
+            config = checked.get_global_config()
+            assert config["output_format"]["colors"] is True
+            assert config["server_templates"]["web"]["ports"] == [3000, 8000, 8080]
+            assert config["servers"] == [{"name": "Web", "ports": [3000]}]
+            assert checked.get_project_config("demo-project")["repositories"] == []
+
+
+class TestListProjects:
+    """Test project listing."""
+
+    def test_list_projects_reads_summary(self, tmp_path):
+        """Test project metadata is listed for saved projects."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        manager.save_project_config(
+            {"name": "demo app", "type": "single", "root_path": "/work/demo", "servers": []},
+            "demo-project",
+        )
+
+        assert manager.list_projects() == [
+            {"name": "demo app", "type": "single", "root_path": "/work/demo", "id": "demo-project"}
+        ]
+
+    def test_list_projects_falls_back_to_full_parse(self, tmp_path):
+        """Test metadata beyond the scanned header is still found."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        servers = [{"name": f"server-{i}", "ports": [3000 + i]} for i in range(100)]
+        manager.save_project_config(
+            {"name": "big", "type": "multi", "root_path": "/work/big", "servers": servers},
+            "big-project",
+        )
+
+        (project,) = manager.list_projects()
+        assert project["type"] == "multi"
+        assert project["root_path"] == "/work/big"
+
+    def test_list_projects_keeps_wrapped_values(self, tmp_path):
+        """Test long values the YAML dumper wraps onto continuation lines stay whole."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        root_path = (
+            "/Users/someone/My Projects/Client Work/Some Long Folder Name With Spaces"
+            "/another level/app"
+        )
+        manager.save_project_config(
+            {"name": "client", "type": "single", "root_path": root_path, "servers": []},
+            "client-project",
+        )
+
+        (project,) = manager.list_projects()
+        assert project["root_path"] == root_path
+
+
+class TestProjectId:
+    """Test project identification."""
+
+    def test_default_id_follows_current_directory(self, tmp_path, monkeypatch):
+        """Test the cached id for the current project is re-resolved after chdir."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        _write_git_config(first, '[remote "origin"]\n\turl = git@github.com:user/first.git\n')
+        _write_git_config(second, '[remote "origin"]\n\turl = git@github.com:user/second.git\n')
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+
+        monkeypatch.chdir(first)
+        assert manager.get_project_id() == "github.com-user-first"
+        monkeypatch.chdir(second)
+        assert manager.get_project_id() == "github.com-user-second"
+
+    def test_local_project_id_is_stable(self, tmp_path):
+        """Test non-git projects keep the path-hash id used by saved configs."""
+        manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        expected = hashlib.sha256(str(tmp_path.resolve()).encode()).hexdigest()[:16]
+
+        assert manager.get_project_id(str(tmp_path)) == f"local-{expected}"
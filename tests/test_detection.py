@@ -0,0 +1,147 @@
+"""Tests for project and server detection."""
+
+import socket
+import sys
+
+import pytest
+
+from src.detection import FileIndex, ProjectDetector, ServerDetector, ServerPattern
+
+
+class TestServerSuggestions:
+    """Test server suggestions from project files."""
+
+    def test_matches_nested_files(self, tmp_path):
+        """Test literal and glob patterns match files below the project root."""
+        (tmp_path / "api").mkdir()
+        (tmp_path / "api" / "app.py").write_text("")
+        (tmp_path / "package.json").write_text("{}")
+
+        names = {server["name"] for server in ProjectDetector(str(tmp_path)).suggest_servers()}
+        assert {"Flask", "Python", "Node"} <= names
+        assert "Docker" not in names
+
+    def test_skips_dependency_directories(self, tmp_path):
+        """Test files inside pruned directories do not trigger suggestions."""
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "Dockerfile").write_text("")
+
+        names = {server["name"] for server in ProjectDetector(str(tmp_path)).suggest_servers()}
+        assert "Docker" not in names
+        assert "Node" in names  # the node_modules/ directory itself still counts
+
+    def test_pattern_classification(self, tmp_path):
+        """Test server patterns are split by match kind and still match globs."""
+        pattern = ServerPattern.build(
+            "Compose", (8080,), "🐳", ("Dockerfile", "*.yml", "deploy/", "docker-*.yaml")
+        )
+        assert pattern.file_names == {"Dockerfile"}
+        assert pattern.extensions == {".yml"}
+        assert pattern.dir_names == {"deploy"}
+        assert pattern.globs == ("docker-*.yaml",)
+
+        (tmp_path / "docker-dev.yaml").write_text("")
+        assert pattern.matches(FileIndex.build(tmp_path))
+
+
+class TestFileIndex:
+    """Test the in-memory project file index."""
+
+    def test_pattern_kinds(self, tmp_path):
+        """Test literal, extension, glob and directory patterns."""
+        (tmp_path / "migrations").mkdir()
+        (tmp_path / "schema.sql").write_text("")
+        (tmp_path / "docker-compose.yml").write_text("")
+
+        index = FileIndex.build(tmp_path)
+        assert index.matches("docker-compose.yml")
+        assert index.matches("*.sql")
+        assert index.matches("docker-*.yml")
+        assert index.matches("migrations/")
+        assert not index.matches("schema.sql/")
+        assert not index.matches("*.py")
+
+    def test_depth_is_bounded(self, tmp_path):
+        """Test files below the depth limit are not indexed."""
+        deep = tmp_path / "a" / "b" / "c" / "d"
+        deep.mkdir(parents=True)
+        (deep / "Dockerfile").write_text("")
+
+        assert not FileIndex.build(tmp_path).matches("Dockerfile")
+        assert FileIndex.build(tmp_path, max_depth=4).matches("Dockerfile")
+
+
+class TestProjectType:
+    """Test project type detection."""
+
+    def test_monolith_from_gitmodules(self, tmp_path):
+        """Test submodule paths are parsed from .gitmodules."""
+        (tmp_path / ".gitmodules").write_text(
+            "".join(
+                f'[submodule "{name}"]\n\tpath = {name}\n\turl = ../{name}.git\n'
+                for name in ("api", "web", "docs")
+            )
+        )
+
+        detector = ProjectDetector(str(tmp_path))
+        assert detector._get_submodules() == ["api", "web", "docs"]
+        assert detector.detect_project_type() == "monolith"
+
+    def test_detected_type_is_memoized(self, tmp_path):
+        """Test later calls reuse the first detection result."""
+        detector = ProjectDetector(str(tmp_path))
+        assert detector.detect_project_type() == "custom"
+
+        (tmp_path / ".git").mkdir()
+        assert detector.detect_project_type() == "custom"
+        assert ProjectDetector(str(tmp_path)).detect_project_type() == "single"
+
+    def test_two_submodules_is_not_monolith(self, tmp_path):
+        """Test fewer than three submodules falls through to the next project type."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".gitmodules").write_text(
+            '[submodule "api"]\n\tpath = api\n[submodule "web"]\n\tpath = web\n'
+        )
+
+        assert ProjectDetector(str(tmp_path)).detect_project_type() == "single"
+
+    def test_multi_repo_workspace(self, tmp_path):
+        """Test subdirectories with .git dirs or files are suggested as repositories."""
+        (tmp_path / "api" / ".git").mkdir(parents=True)
+        (tmp_path / "web").mkdir()
+        (tmp_path / "web" / ".git").write_text("gitdir: ../.worktrees/web\n")
+        (tmp_path / "docs").mkdir()
+
+        detector = ProjectDetector(str(tmp_path))
+        assert detector.detect_project_type() == "multi"
+        assert sorted(detector.suggest_repositories(), key=lambda repo: repo["path"]) == [
+            {"name": "API", "path": "api", "type": "repository"},
+            {"name": "WEB", "path": "web", "type": "repository"},
+        ]
+
+
+class TestServerDetector:
+    """Test active server detection."""
+
+    def test_first_active_port_per_server(self, monkeypatch):
+        """Test each server reports its first listening port and disabled ones are skipped."""
+        monkeypatch.setattr(ServerDetector, "_active_ports", lambda self: frozenset({3001, 8000}))
+        configs = [
+            {"name": "Node", "ports": [3000, 3001], "emoji": "🟢"},
+            {"name": "Django", "ports": [8000], "emoji": "🐍", "enabled": False},
+            {"name": "Vite", "ports": [5173], "emoji": "⚡"},
+        ]
+
+        assert ServerDetector().detect_servers(configs) == [
+            {"name": "Node", "port": 3001, "emoji": "🟢"}
+        ]
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/net/tcp")
+    def test_linux_listening_socket(self):
+        """Test a listening socket shows up in the /proc/net/tcp scan."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen()
+            port = sock.getsockname()[1]
+
+            assert port in ServerDetector._active_ports_linux()
@@ -0,0 +1,124 @@
+"""Tests for git status parsing."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from src.cache import StatusCache
+from src.git import GitManager, RepoStatus
+
+
+class TestPorcelainV2:
+    """Test parsing of `git status --branch --porcelain=v2` output."""
+
+    def test_clean_branch_with_upstream(self):
+        """Test branch, behind count and clean state."""
+        output = (
+            b"# branch.oid 1234567890abcdef1234567890abcdef12345678\n"
+            b"# branch.head main\n"
+            b"# branch.upstream origin/main\n"
+            b"# branch.ab +1 -3"
+        )
+        assert GitManager._parse_porcelain_v2(output) == ("main", 3, False)
+
+    def test_changes_and_untracked(self):
+        """Test worktree entries mark the repo as changed."""
+        output = (
+            b"# branch.oid 1234567890abcdef1234567890abcdef12345678\n"
+            b"# branch.head feature/auth\n"
+            b"1 .M N... 100644 100644 100644 aaaa bbbb src/app.py\n"
+            b"? notes.txt"
+        )
+        assert GitManager._parse_porcelain_v2(output) == ("feature/auth", 0, True)
+
+    def test_detached_head_uses_short_hash(self):
+        """Test detached HEAD falls back to the abbreviated commit."""
+        output = b"# branch.oid 1234567890abcdef1234567890abcdef12345678\n# branch.head (detached)"
+        assert GitManager._parse_porcelain_v2(output) == ("1234567", 0, False)
+
+    def test_unborn_branch(self):
+        """Test a repository without commits still reports its branch."""
+        output = b"# branch.oid (initial)\n# branch.head main"
+        assert GitManager._parse_porcelain_v2(output) == ("main", 0, False)
+
+
+class TestFastHead:
+    """Test reading the current branch straight from .git/HEAD."""
+
+    def test_branch_ref(self, tmp_path):
+        """Test a symbolic HEAD yields the branch name."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/feature/login\n")
+        assert GitManager._fast_head(tmp_path) == "feature/login"
+
+    def test_detached_head(self, tmp_path):
+        """Test a detached HEAD yields the abbreviated commit."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("1234567890abcdef1234567890abcdef12345678\n")
+        assert GitManager._fast_head(tmp_path) == "1234567"
+
+    def test_missing_git_dir(self, tmp_path):
+        """Test a path without .git/HEAD yields nothing."""
+        assert GitManager._fast_head(tmp_path) is None
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestRepoStatuses:
+    """Test collecting status for several repositories."""
+
+    def test_statuses_keep_config_order(self, tmp_path):
+        """Test results follow the config order and skip paths that are not repos."""
+        for name, branch in (("api", "main"), ("web", "feature/ui")):
+            subprocess.run(["git", "init", "-q", "-b", branch, str(tmp_path / name)], check=True)
+        (tmp_path / "web" / "notes.txt").write_text("wip")
+        configs = [
+            {"name": "WEB", "path": "web"},
+            {"name": "MISSING", "path": "missing"},
+            {"name": "API", "path": "api"},
+        ]
+
+        assert GitManager().get_repo_statuses(configs, str(tmp_path)) == [
+            RepoStatus("WEB", "feature/ui", 0, True, "web"),
+            RepoStatus("API", "main", 0, False, "api"),
+        ]
+
+    def test_running_processes_stay_within_window(self, tmp_path, monkeypatch):
+        """Test no more than the window of git processes run at once."""
+        names = [f"repo{i}" for i in range(4)]
+        for name in names:
+            subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path / name)], check=True)
+        monkeypatch.setattr("src.git._MAX_RUNNING_STATUS", 2)
+        running, peak = set(), []
+        real_popen = subprocess.Popen
+
+        class TrackedPopen(real_popen):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                running.add(self)
+                peak.append(len(running))
+
+            def communicate(self, *args, **kwargs):
+                try:
+                    return super().communicate(*args, **kwargs)
+                finally:
+                    running.discard(self)
+
+        monkeypatch.setattr("src.git.subprocess.Popen", TrackedPopen)
+        configs = [{"name": name.upper(), "path": name} for name in names]
+
+        statuses = GitManager().get_repo_statuses(configs, str(tmp_path))
+
+        assert [status.name for status in statuses] == [name.upper() for name in names]
+        assert max(peak) == 2
+
+    def test_malformed_cached_status_is_recomputed(self, tmp_path):
+        """Test a cached status missing fields is ignored rather than raising."""
+        subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path / "api")], check=True)
+        manager = GitManager(StatusCache(cache_file=tmp_path / "status.json"))
+        signature = manager._status_signature(tmp_path / "api")
+        manager.status_cache.set(str(tmp_path / "api"), signature, {"behind": 0})
+
+        assert manager.get_repo_statuses([{"name": "API", "path": "api"}], str(tmp_path)) == [
+            RepoStatus("API", "main", 0, False, "api")
+        ]
@@ -0,0 +1,39 @@
+"""Tests for import-time behaviour of the status line render path."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """Run an import in a fresh interpreter and return the loaded src modules."""
+    script = (
+        f"import sys; {statement}; print(' '.join(m for m in sys.modules if m.startswith('src')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """Test that wizard-only modules stay off the render path."""
+
+    def test_package_import_is_lazy(self):
+        """Test importing the package does not load any submodule."""
+        assert _loaded_modules("import src") == {"src"}
+
+    def test_cli_import_skips_setup_wizard(self):
+        """Test the CLI entry point does not load the setup wizard."""
+        assert "src.setup" not in _loaded_modules("import src.cli")
+
+    def test_lazy_export_resolves(self):
+        """Test public names are still importable from the package."""
+        assert "src.setup" in _loaded_modules("from src import SetupWizard")
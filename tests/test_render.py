@@ -1,15 +1,10 @@
 """Tests for rendering functionality."""
 
 import os
-import sys
-from pathlib import Path
 from unittest.mock import patch
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from git import RepoStatus
-from render import StatusLineRenderer
+from src.git import RepoStatus
+from src.render import StatusLineRenderer
 
 
 class TestStatusLineRenderer:
@@ -0,0 +1,93 @@
+"""Tests for the setup wizard."""
+
+import json
+
+from src.config import ConfigManager
+from src.setup import SetupWizard
+
+
+class TestSetupWizard:
+    """Test setup wizard behaviour."""
+
+    def test_assume_yes_uses_detected_defaults(self, tmp_path, monkeypatch):
+        """Test --yes builds the config from detection without prompting."""
+        project = tmp_path / "shop"
+        (project / ".git").mkdir(parents=True)
+        (project / "package.json").write_text("{}")
+        monkeypatch.chdir(project)
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        config_manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        config = SetupWizard(config_manager, assume_yes=True).run_setup()
+
+        assert config["name"] == "shop"
+        assert config["type"] == "single"
+        assert config["repositories"] == [{"name": "SHOP", "path": ".", "type": "main"}]
+        assert [server["name"] for server in config["servers"]] == ["Node"]
+        assert config["created_at"] == config["updated_at"]
+
+        settings = json.loads((project / ".claude" / "settings.json").read_text())
+        assert settings["statusLine"]["type"] == "command"
+
+    def test_claude_settings_keep_existing_keys(self, tmp_path, monkeypatch):
+        """Test the status line is merged into existing Claude Code settings."""
+        settings_file = tmp_path / ".claude" / "settings.json"
+        settings_file.parent.mkdir()
+        settings_file.write_text('{"model": "sonnet"}')
+        monkeypatch.chdir(tmp_path)
+
+        config_manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        SetupWizard(config_manager, assume_yes=True)._configure_claude_code()
+
+        settings = json.loads(settings_file.read_text())
+        assert settings["model"] == "sonnet"
+        assert settings["statusLine"]["padding"] == 0
+
+    def test_assume_yes_leaves_global_claude_settings_alone(self, tmp_path, monkeypatch):
+        """Test --yes writes project-local Claude Code settings even when global ones exist."""
+        home, project = tmp_path / "home", tmp_path / "project"
+        global_settings = home / ".claude" / "settings.json"
+        global_settings.parent.mkdir(parents=True)
+        global_settings.write_text('{"model": "opus"}')
+        project.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(project)
+
+        config_manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        SetupWizard(config_manager, assume_yes=True)._configure_claude_code()
+
+        assert global_settings.read_text() == '{"model": "opus"}'
+        settings = json.loads((project / ".claude" / "settings.json").read_text())
+        assert settings["statusLine"]["type"] == "command"
+
+    def test_parse_repo_line(self):
+        """Test single-line NAME:PATH:TYPE repository entries."""
+        assert SetupWizard._parse_repo_line("api:services/api:repository") == {
+            "name": "API",
+            "path": "services/api",
+            "type": "repository",
+        }
+        assert SetupWizard._parse_repo_line(r"web:C:\src\web:main")["path"] == r"C:\src\web"
+        assert SetupWizard._parse_repo_line("api:services/api") is None
+        assert SetupWizard._parse_repo_line("api:services/api:library") is None
+
+    def test_parse_ports(self):
+        """Test port lists must be whole numbers within the valid port range."""
+        assert SetupWizard._parse_ports("3000, 8000 9000") == [3000, 8000, 9000]
+        assert SetupWizard._parse_ports("3000.5") is None
+        assert SetupWizard._parse_ports("8000-8010") is None
+        assert SetupWizard._parse_ports("0,70000") is None
+        assert SetupWizard._parse_ports("  ") is None
+
+    def test_manual_repos_accept_single_line_entries(self, tmp_path, monkeypatch):
+        """Test single-line and per-field entries can be mixed."""
+        names = iter(["api:services/api:submodule", "web", ""])
+        fields = iter(["apps/web", "repository"])
+        monkeypatch.setattr("builtins.input", lambda prompt: next(names))
+        monkeypatch.setattr("click.prompt", lambda *args, **kwargs: next(fields))
+
+        config_manager = ConfigManager(custom_config_dir=str(tmp_path / "config"))
+        assert SetupWizard(config_manager)._manual_repo_config() == [
+            {"name": "API", "path": "services/api", "type": "submodule"},
+            {"name": "WEB", "path": "apps/web", "type": "repository"},
+        ]